@@ -3,7 +3,6 @@ A set of components and tools to test yap-midi components.
 """
 
 import asyncio
-import struct
 
 from ymidi.decoder import ModularDecoder, MetaDecoder
 from ymidi.events.voice import NoteEvent, NoteOff, NoteOn
@@ -366,4 +365,6 @@ async def test_seq():
 
 
 #midi_stream()
-asyncio.run(test_route(), debug=True)
+if __name__ == "__main__":
+
+    asyncio.run(test_route(), debug=True)
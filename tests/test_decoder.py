@@ -0,0 +1,744 @@
+"""
+Tests for the yap-midi decoders.
+"""
+
+import asyncio
+import pickle
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from ymidi.decoder import ModularDecoder, MetaDecoder, DecodedTrack
+from ymidi.errors import DecodeException
+from ymidi.events.builtin import UnknownEvent
+from ymidi.events.meta import EndOfTrack, SetTempo, TrackName
+from ymidi.events.system.common import SongPositionPointer, SongSelect, TuneRequest
+from ymidi.events.system.mtc import MTCQuarterFrame
+from ymidi.events.system.realtime import TimingClock
+from ymidi.events.system.system_exc import SystemExclusive, UniversalSysExc
+from ymidi.events.voice import ControlChange, NoteOff, NoteOn, ProgramChange
+
+# Stream with running status, a realtime message, and a system exclusive message:
+
+STREAM = bytes([0x90, 60, 64, 61, 65, 0xF0, 1, 2, 0xF7, 0xB2, 7, 100, 0xF8, 0xC1, 5])
+
+# Stream with events interrupted by other events, from test.py:
+
+INTERRUPTED = bytes([0x90, 60, 0xF8, 0xF0, 1, 2, 0xF8, 3, 4, 5, 0xF7, 64, 60, 0x80, 30, 0xF8, 0x90, 55, 55, 30, 64, 78, 23, 0xF8])
+
+# Malformed streams that must raise instead of hanging or returning garbage:
+
+ZERO_LENGTH_DATA = (b'\xf8\x01', b'\xf6\x05', b'\x90\x01\x02\xf7\x03')
+TRUNCATED = (b'\x90\x01', b'\x90\x01\x02\x03', b'\xc0', b'\xf2\x01')
+
+
+@pytest.fixture
+def decoder():
+    """
+    ModularDecoder with the default events loaded.
+    """
+
+    decoder = ModularDecoder()
+    decoder.load_default()
+
+    return decoder
+
+
+def describe(events):
+    """
+    Gets the name and data of each event, for easy comparison.
+    """
+
+    return [(type(event).__name__, tuple(event.data)) for event in events]
+
+
+def seq_decode_all(decoder, bts):
+    """
+    Decodes the bytes one at a time using seq_decode().
+    """
+
+    final = []
+
+    for byte in bts:
+
+        event = decoder.seq_decode(byte)
+
+        if event is not None:
+
+            final.append(event)
+
+    return final
+
+
+STREAM_EVENTS = [('NoteOn', (60, 64)), ('NoteOn', (61, 65)), ('SystemExclusive', (1, 2)), ('ControlChange', (7, 100)), ('TimingClock', ()), ('ProgramChange', (5,))]
+
+
+def test_decode(decoder):
+    """
+    Tests decoding single events, with and without running status.
+    """
+
+    event = decoder.decode(b'\x93\x3c\x40')
+
+    assert isinstance(event, NoteOn)
+    assert (event.pitch, event.velocity, event.channel) == (60, 64, 3)
+
+    event = decoder.decode(b'\x3d\x41')
+
+    assert isinstance(event, NoteOn) and event.channel == 3 and event.pitch == 61
+
+    assert bytes(decoder.decode(b'\xf0\x01\x02\xf7').data) == b'\x01\x02'
+    assert isinstance(decoder.decode(b'\xf4\x01'), UnknownEvent)
+
+
+def test_decode_no_status():
+    """
+    Tests that data without any status message raises DecodeException.
+    """
+
+    decoder = ModularDecoder()
+    decoder.load_default()
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode(b'\x01\x02')
+
+
+@pytest.mark.parametrize('bts', TRUNCATED[:1] + (b'\xc0',))
+def test_decode_truncated(decoder, bts):
+    """
+    Tests that decode() raises DecodeException for missing data bytes.
+    """
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode(bts)
+
+
+def test_decode_stream(decoder):
+    """
+    Tests decoding a stream with running status and system events.
+    """
+
+    events = decoder.decode_stream(STREAM)
+
+    assert describe(events) == STREAM_EVENTS
+    assert events[3].channel == 2 and events[5].channel == 1
+
+
+def test_decode_stream_unknown(decoder):
+    """
+    Tests that unknown events continue until the next status message.
+    """
+
+    events = decoder.decode_stream(b'\xf4\x01\x02\x90\x01\x02')
+
+    assert isinstance(events[0], UnknownEvent)
+    assert events[0].statusmsg == 0xF4 and events[0].data == (1, 2)
+    assert isinstance(events[1], NoteOn)
+
+
+def test_decode_stream_unterminated(decoder):
+    """
+    Tests that variable length events without an end raise DecodeException.
+    """
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode_stream(b'\xf0\x01\x02')
+
+
+def test_decode_stream_leading_data(decoder):
+    """
+    Tests that data bytes without a status message raise DecodeException, like decode().
+    """
+
+    for method in (decoder.decode, decoder.decode_stream, decoder.scan_stream):
+
+        with pytest.raises(DecodeException):
+
+            method(b'\x01\x02\x90\x01\x02')
+
+
+@pytest.mark.parametrize('bts', ZERO_LENGTH_DATA)
+def test_decode_stream_zero_length_data(decoder, bts):
+    """
+    Tests that data bytes after an event without data raise DecodeException.
+    """
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode_stream(bts)
+
+
+@pytest.mark.parametrize('bts', TRUNCATED)
+def test_decode_stream_truncated(decoder, bts):
+    """
+    Tests that truncated events raise DecodeException.
+    """
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode_stream(bts)
+
+
+def test_decode_stream_zero_length_events(decoder):
+    """
+    Tests that events without data decode correctly next to each other.
+    """
+
+    assert describe(decoder.decode_stream(b'\xf8\xf6\xf8\x90\x01\x02')) == [('TimingClock', ()), ('TuneRequest', ()), ('TimingClock', ()), ('NoteOn', (1, 2))]
+
+
+def test_decode_stream_system_common(decoder):
+    """
+    Tests that the system common events decode with their own status messages.
+    """
+
+    events = decoder.decode_stream(b'\xf1\x35\xf2\x01\x02\xf3\x05')
+
+    assert [type(event) for event in events] == [MTCQuarterFrame, SongPositionPointer, SongSelect]
+    assert (events[0].type, events[0].value) == (3, 5)
+    assert events[2].song == 5
+
+
+def test_decode_tracks(decoder):
+    """
+    Tests decoding many tracks, with and without an executor.
+    """
+
+    tracks = [STREAM, b'\x80\x01\x02\x03\x04']
+
+    expected = [describe(decoder.decode_stream(track)) for track in tracks]
+
+    assert [describe(events) for events in decoder.decode_tracks(tracks)] == expected
+
+    with ProcessPoolExecutor(2) as executor:
+
+        assert [describe(events) for events in decoder.decode_tracks(tracks, executor)] == expected
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode_tracks([b'\xf8\x01'])
+
+
+def test_pickle(decoder):
+    """
+    Tests that decoders are rebuilt with the same tables when unpickled.
+    """
+
+    decoder.nest_limit = 3
+    decoder.share_realtime()
+
+    copy = pickle.loads(pickle.dumps(decoder))
+
+    assert copy._status_table == decoder._status_table
+    assert copy._length_table == decoder._length_table
+    assert copy.nest_limit == 3
+    assert copy.decode(b'\xf8') is copy.decode(b'\xf8')
+    assert describe(copy.decode_stream(STREAM)) == STREAM_EVENTS
+
+
+def test_pickle_custom():
+    """
+    Tests pickling decoders with custom tables.
+    """
+
+    decoder = ModularDecoder()
+
+    decoder.load_event(NoteOn)
+    decoder.load_event(ProgramChange)
+    decoder.load_event(TimingClock)
+
+    copy = pickle.loads(pickle.dumps(decoder))
+
+    assert copy._status_table == decoder._status_table
+    assert describe(copy.decode_stream(b'\x93\x01\x02\x03\x04\xf8\xc1\x05')) == [('NoteOn', (1, 2)), ('NoteOn', (3, 4)), ('TimingClock', ()), ('ProgramChange', (5,))]
+
+    meta = MetaDecoder()
+
+    meta.load_event(SetTempo)
+    meta.load_event(NoteOn)
+    meta.meta_default = TrackName
+
+    copy = pickle.loads(pickle.dumps(meta))
+
+    assert copy.meta_collection == meta.meta_collection
+    assert copy.collection == meta.collection
+    assert copy.meta_default is TrackName
+
+
+def test_scan_stream(decoder):
+    """
+    Tests finding the boundaries of each event.
+    """
+
+    statuses, starts, stops = decoder.scan_stream(STREAM)
+
+    assert statuses == [0x90, 0x90, 0xF0, 0xB2, 0xF8, 0xC1]
+    assert [STREAM[start:stop] for start, stop in zip(starts, stops)] == [b'\x3c\x40', b'\x3d\x41', b'\x01\x02', b'\x07\x64', b'', b'\x05']
+
+
+def test_scan_stream_long_run(decoder):
+    """
+    Tests that long runs of running status are scanned correctly.
+    """
+
+    bts = b'\x90' + bytes(range(100)) + b'\xf8\x80\x01\x02'
+
+    statuses, starts, stops = decoder.scan_stream(bts)
+
+    assert statuses == [0x90] * 50 + [0xF8, 0x80]
+    assert starts[:50] == list(range(1, 101, 2))
+    assert stops[:50] == list(range(3, 103, 2))
+    assert describe(decoder.decode_track(bts)) == describe(decoder.decode_stream(bts))
+
+
+@pytest.mark.parametrize('bts', ZERO_LENGTH_DATA + TRUNCATED)
+def test_scan_stream_malformed(decoder, bts):
+    """
+    Tests that scanning malformed bytes raises DecodeException.
+    """
+
+    with pytest.raises(DecodeException):
+
+        decoder.scan_stream(bts)
+
+    with pytest.raises(DecodeException):
+
+        decoder.normalize_running_status(bts)
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode_track(bts)
+
+
+def test_normalize_running_status(decoder):
+    """
+    Tests adding the status message to each event.
+    """
+
+    normal = decoder.normalize_running_status(STREAM)
+
+    assert normal == bytes([0x90, 60, 64, 0x90, 61, 65, 0xF0, 1, 2, 0xF7, 0xB2, 7, 100, 0xF8, 0xC1, 5])
+    assert describe(decoder.decode_stream(normal)) == STREAM_EVENTS
+
+
+def test_decode_track(decoder):
+    """
+    Tests lazily decoding events with a DecodedTrack.
+    """
+
+    track = decoder.decode_track(STREAM)
+
+    assert len(track) == 6
+    assert describe(track) == STREAM_EVENTS
+    assert describe([track[index] for index in range(len(track))]) == STREAM_EVENTS
+    assert bytes(track.data(3)) == b'\x07\x64'
+    assert track.count(0x90) == 2
+    assert bytes(track) == decoder.normalize_running_status(STREAM)
+
+    notes = track.select(0x90, 0xC1)
+
+    assert describe(notes) == [('NoteOn', (60, 64)), ('NoteOn', (61, 65)), ('ProgramChange', (5,))]
+    assert notes.bts is track.bts
+    assert len(track.select(0x80)) == 0
+
+    with pytest.raises(IndexError):
+
+        track[10]
+
+
+def test_decoded_track_append(decoder):
+    """
+    Tests adding events to a DecodedTrack.
+    """
+
+    track = DecodedTrack(decoder)
+
+    track.append(NoteOn(60, 64, channel=2))
+    track.append(SystemExclusive(1, 2, 3))
+    track.append(TimingClock())
+
+    assert describe(track) == [('NoteOn', (60, 64)), ('SystemExclusive', (1, 2, 3)), ('TimingClock', ())]
+    assert track[0].channel == 2
+    assert bytes(track) == b'\x92\x3c\x40\xf0\x01\x02\x03\xf7\xf8'
+
+    with pytest.raises(ValueError):
+
+        track.append(EndOfTrack())
+
+
+def test_decoded_track_truncated(decoder):
+    """
+    Tests that creating a truncated event from a DecodedTrack raises DecodeException.
+    """
+
+    track = DecodedTrack(decoder, bytearray(b'\x90\x01'), bytearray([0x90]), array('L', [1]), array('L', [3]))
+
+    with pytest.raises(DecodeException):
+
+        track[0]
+
+    with pytest.raises(DecodeException):
+
+        list(track)
+
+
+def test_seq_decode(decoder):
+    """
+    Tests sequentially decoding a well structured stream.
+    """
+
+    assert describe(seq_decode_all(decoder, STREAM)) == STREAM_EVENTS
+
+
+def test_seq_decode_interrupted(decoder):
+    """
+    Tests that interrupted events are restored in order, however deeply they are nested.
+    """
+
+    expected = [('TimingClock', ()), ('TimingClock', ()), ('SystemExclusive', (1, 2, 3, 4, 5)), ('NoteOn', (60, 64)), ('TimingClock', ()), ('NoteOn', (55, 55)), ('NoteOff', (30, 30)), ('NoteOn', (60, 64)), ('NoteOn', (78, 23)), ('TimingClock', ())]
+
+    assert describe(seq_decode_all(decoder, INTERRUPTED)) == expected
+
+    decoder.reset()
+
+    assert describe(decoder.seq_decode_buffer(INTERRUPTED)) == expected
+
+
+def test_seq_decode_nest_limit(decoder):
+    """
+    Tests that events interrupted past the nest limit are dropped.
+    """
+
+    decoder.nest_limit = 1
+
+    events = describe(decoder.seq_decode_buffer(INTERRUPTED))
+
+    assert ('NoteOff', (30, 30)) not in events
+    assert ('NoteOn', (60, 30)) in events
+
+
+def test_seq_decode_buffer_split(decoder):
+    """
+    Tests that events split across buffers are decoded.
+    """
+
+    first = decoder.seq_decode_buffer(STREAM[:4])
+    second = decoder.seq_decode_buffer(STREAM[4:])
+
+    assert describe(first + second) == STREAM_EVENTS
+
+
+def test_feed(decoder):
+    """
+    Tests feeding chunks of bytes in different formats.
+    """
+
+    events = []
+
+    events += decoder.feed(bytearray(STREAM[:7]))
+    events += decoder.feed(memoryview(STREAM[7:]))
+
+    assert describe(events) == STREAM_EVENTS
+
+    decoder.reset()
+
+    assert describe(decoder.feed(memoryview(array('H', [0x3c90, 0x9040, 0x4141])))) == [('NoteOn', (60, 64)), ('NoteOn', (65, 65))]
+
+
+def test_meta_feed():
+    """
+    Tests feeding chunks of a stream with meta events.
+    """
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    bts = bytes.fromhex('903c40ff510307a120803c00')
+    events = []
+
+    for index in range(0, len(bts), 5):
+
+        events += decoder.feed(memoryview(bts)[index:index + 5])
+
+    assert [type(event) for event in events] == [NoteOn, SetTempo, NoteOff]
+    assert events[1].tempo == 500000
+
+
+def test_adecode_stream(decoder):
+    """
+    Tests decoding events read from an asyncio reader.
+    """
+
+    async def run():
+
+        reader = asyncio.StreamReader()
+
+        reader.feed_data(STREAM)
+        reader.feed_eof()
+
+        return [event async for event in decoder.adecode_stream(reader, size=4)]
+
+    assert describe(asyncio.run(run())) == STREAM_EVENTS
+
+
+def test_meta_adecode_stream():
+    """
+    Tests decoding meta events read from an asyncio reader.
+    """
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    async def run():
+
+        reader = asyncio.StreamReader()
+
+        reader.feed_data(bytes.fromhex('903c40ff510307a120803c00'))
+        reader.feed_eof()
+
+        return [event async for event in decoder.adecode_stream(reader, size=3)]
+
+    assert [type(event) for event in asyncio.run(run())] == [NoteOn, SetTempo, NoteOff]
+
+
+def test_share_realtime(decoder):
+    """
+    Tests that shared realtime events are returned by every decoding method.
+    """
+
+    decoder.share_realtime()
+
+    clock = decoder.decode(b'\xf8')
+
+    assert decoder.decode_stream(b'\xf8\xf8') == [clock, clock]
+    assert decoder.seq_decode(0xF8) is clock
+    assert not isinstance(decoder.decode(b'\x90\x01\x02'), TimingClock)
+
+
+def test_encode(decoder):
+    """
+    Tests encoding single events.
+    """
+
+    assert decoder.encode(NoteOn(60, 64, channel=3)) == b'\x93\x3c\x40'
+    assert decoder.encode(SystemExclusive(1, 2)) == b'\xf0\x01\x02'
+    assert decoder.encode(TimingClock()) is decoder.encode(TimingClock())
+    assert decoder.encode(TuneRequest()) == b'\xf6'
+
+
+def test_encode_into(decoder):
+    """
+    Tests encoding events into an existing buffer.
+    """
+
+    events = [NoteOn(60, 64, channel=1), TimingClock(), SystemExclusive(1, 2, 3, 4, 5), ProgramChange(5)]
+
+    buf = bytearray(4)
+    offset = 0
+
+    for event in events:
+
+        offset += decoder.encode_into(event, buf, offset)
+
+    assert offset == len(buf)
+    assert bytes(buf) == b''.join(decoder.encode(event) for event in events)
+
+    # Overwrite the middle of the buffer:
+
+    assert decoder.encode_into(NoteOff(1, 2), buf, 1) == 3
+    assert buf[:4] == b'\x91\x80\x01\x02'
+
+    assert decoder.encode_into(SetTempo(7, 161, 32), buf, len(buf)) == 6
+
+    with pytest.raises(ValueError):
+
+        decoder.encode_into(NoteOn(1, 2), buf, len(buf) + 1)
+
+
+def test_encode_many(decoder):
+    """
+    Tests encoding many events at once.
+    """
+
+    events = decoder.decode_stream(STREAM)
+
+    assert decoder.encode_many(events) == b''.join(decoder.encode(event) for event in events)
+
+
+def test_encode_track(decoder):
+    """
+    Tests encoding events using running status.
+    """
+
+    events = [NoteOn(60, 64), NoteOn(61, 65), NoteOn(62, 66, channel=1), TimingClock(), NoteOn(63, 67, channel=1), ControlChange(7, 100, channel=1)]
+
+    bts = decoder.encode_track(events)
+
+    assert bts == bytes([0x90, 60, 64, 61, 65, 0x91, 62, 66, 0xF8, 0x91, 63, 67, 0xB1, 7, 100])
+    assert describe(decoder.decode_stream(bts)) == describe(events)
+
+
+def test_meta_decode():
+    """
+    Tests decoding and encoding meta events.
+    """
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    event = decoder.decode(b'\xff\x51\x03\x07\xa1\x20')
+
+    assert isinstance(event, SetTempo) and event.tempo == 500000
+    assert bytes(event) == b'\xff\x51\x03\x07\xa1\x20'
+
+    event = decoder.decode(b'\xff\x03\x04test')
+
+    assert isinstance(event, TrackName) and event.text == 'test'
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode(b'\xff\x51\x04\x07\xa1\x20')
+
+
+def test_meta_seq_decode():
+    """
+    Tests sequentially decoding meta events.
+    """
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    events = seq_decode_all(decoder, b'\xff\x51\x03\x07\xa1\x20\xff\x2f\x00')
+
+    assert [type(event) for event in events] == [SetTempo, EndOfTrack]
+    assert events[0].tempo == 500000
+
+
+def test_meta_decode_stream():
+    """
+    Tests that meta events are decoded in streams.
+    """
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    bts = bytes.fromhex('903c40ff510307a120803c00ff0100ff600201029001020304')
+
+    events = decoder.decode_stream(bts)
+
+    assert describe(events) == [('NoteOn', (60, 64)), ('SetTempo', (7, 161, 32)), ('NoteOff', (60, 0)), ('MetaText', ()), ('UnknownMetaEvent', (1, 2)), ('NoteOn', (1, 2)), ('NoteOn', (3, 4))]
+    assert events[1].tempo == 500000 and events[4].event_type == 0x60
+
+    decoder.reset()
+
+    assert describe(decoder.seq_decode_buffer(bts)) == describe(events)
+
+
+@pytest.mark.parametrize('bts', ['ff', 'ff51', 'ff5103', 'ff510307a1', 'ff5181', '903c40ff01000102'])
+def test_meta_decode_stream_malformed(bts):
+    """
+    Tests that malformed meta events and data after them raise DecodeException.
+    """
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode_stream(bytes.fromhex(bts))
+
+
+def test_meta_scan_stream():
+    """
+    Tests that scanning meta events raises DecodeException.
+    """
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    assert decoder.scan_stream(b'\x90\x01\x02') == ([0x90], [1], [3])
+
+    with pytest.raises(DecodeException):
+
+        decoder.scan_stream(bytes.fromhex('903c40ff510307a120'))
+
+    with pytest.raises(DecodeException):
+
+        decoder.decode_track(bytes.fromhex('ff0100'))
+
+
+def test_meta_seq_decode_buffer():
+    """
+    Tests that decoding buffers gives the same events as decoding each byte,
+    however the buffers are split.
+    """
+
+    bts = bytes.fromhex('903c40ff510307a120803c00f003010203ff0100813c00')
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    expected = describe(seq_decode_all(decoder, bts))
+
+    assert [name for name, _ in expected] == ['NoteOn', 'SetTempo', 'NoteOff', 'UnknownMetaEvent', 'MetaText', 'NoteOff']
+
+    for split in range(len(bts) + 1):
+
+        decoder.reset()
+
+        assert describe(decoder.seq_decode_buffer(bts[:split]) + decoder.seq_decode_buffer(bts[split:])) == expected
+
+
+def test_meta_encode_track():
+    """
+    Tests encoding a track with delta times and running status.
+    """
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    first = NoteOn(60, 64)
+    second = NoteOn(61, 65)
+    end = EndOfTrack()
+
+    second.delta = 200
+
+    assert decoder.encode_many([first, second, end]) == b'\x00\x90\x3c\x40\x81\x48\x90\x3d\x41\x00\xff\x2f\x00'
+    assert decoder.encode_track([first, second, end]) == b'\x00\x90\x3c\x40\x81\x48\x3d\x41\x00\xff\x2f\x00'
+
+
+def test_universal_sysex(decoder):
+    """
+    Tests that the device ID is split off of universal system exclusive messages.
+    """
+
+    decoder.load_event(UniversalSysExc)
+
+    event = decoder.decode(b'\xf0\x07\x01\x02\xf7')
+
+    assert event.device == 7 and bytes(event.data) == b'\x01\x02'
+    assert decoder.decode_stream(b'\xf0\x07\xf7')[0].device == 7
+
+
+@pytest.mark.parametrize('method', ['decode', 'decode_stream', 'seq_decode_buffer', 'decode_track'])
+def test_universal_sysex_empty(decoder, method):
+    """
+    Tests that universal system exclusive messages without a device ID raise DecodeException.
+    """
+
+    decoder.load_event(UniversalSysExc)
+
+    with pytest.raises(DecodeException):
+
+        list(getattr(decoder, method)(b'\xf0\xf7'))
+
+    # The decoder should still work afterwards:
+
+    decoder.reset()
+
+    assert isinstance(decoder.seq_decode_buffer(b'\x90\x01\x02')[0], NoteOn)
@@ -0,0 +1,182 @@
+"""
+Tests for the yap-midi events.
+"""
+
+import pytest
+
+from ymidi.decoder import MetaDecoder
+from ymidi.events.base import BaseEvent
+from ymidi.events.builtin import UnknownEvent, UnknownMetaEvent
+from ymidi.events.meta import Lyric, MetaText, SetTempo, TimeSignature
+from ymidi.events.system.mtc import MTCQuarterFrame
+from ymidi.events.system.realtime import StartSequence, TimingClock
+from ymidi.events.system.system_exc import SystemExclusive
+from ymidi.events.voice import NoteOff, NoteOn, PitchBendEvent, ProgramChange
+
+
+def test_fields_init():
+    """
+    Tests the generated __init__ method.
+    """
+
+    event = NoteOn(60, 64, channel=5)
+
+    assert event.data == (60, 64)
+    assert (event.pitch, event.velocity, event.channel) == (60, 64, 5)
+    assert NoteOff(1, 2).channel == 0
+    assert ProgramChange(program=7).data == (7,)
+
+    event = TimeSignature(6, 3, 24, 8)
+
+    assert (event.numerator, event.denominator, event.cpm, event.npq) == (6, 3, 24, 8)
+
+    with pytest.raises(TypeError):
+
+        NoteOn(60)
+
+    with pytest.raises(TypeError):
+
+        SetTempo(1, 2, 3, channel=1)
+
+
+@pytest.mark.parametrize('event,data', [(NoteOn(60, 64), (60, 64)), (SetTempo(7, 161, 32), (7, 161, 32)), (BaseEvent(1, 2), (1, 2)), (UnknownEvent(0xF4, 1, 2), (1, 2)), (UnknownMetaEvent(0xFF, 0x60, 1), (1,)), (MTCQuarterFrame(0x35), (0x35,)), (SystemExclusive(1, 2), b'\x01\x02'), (SystemExclusive.frombytes(memoryview(b'\x01\x02')), b'\x01\x02')], ids=lambda value: type(value).__name__)
+def test_init_data(event, data):
+    """
+    Tests that every constructor sets up the data and the bytes cache.
+    """
+
+    assert event.data == data
+    assert event._bytes_cache is None
+
+
+def test_bytes():
+    """
+    Tests encoding events, and updating the cache when they change.
+    """
+
+    event = NoteOn(60, 64, channel=2)
+
+    assert bytes(event) == b'\x92\x3c\x40'
+    assert bytes(event) is bytes(event)
+
+    event.channel = 3
+
+    assert bytes(event) == b'\x93\x3c\x40'
+
+    event.data = (61, 65)
+
+    assert bytes(event) == b'\x93\x3d\x41'
+    assert bytes(PitchBendEvent(0, 64)) == b'\xe0\x00\x40'
+
+
+def test_bytes_no_data():
+    """
+    Tests that events without data share their bytes.
+    """
+
+    assert bytes(TimingClock()) == b'\xf8'
+    assert bytes(TimingClock()) is bytes(TimingClock())
+    assert bytes(StartSequence()) == b'\xfa'
+
+
+def test_mtc_quarter_frame():
+    """
+    Tests creating quarter frames from the packed byte, and from the type and value.
+    """
+
+    event = MTCQuarterFrame(0x35)
+
+    assert event.data == (0x35,)
+    assert (event.type, event.value, event.byte) == (3, 5, 0x35)
+    assert bytes(event) == b'\xf1\x35'
+
+    event = MTCQuarterFrame.fromvalues(7, 15)
+
+    assert (event.data, event.type, event.value) == ((0x7F,), 7, 15)
+
+    with pytest.raises(TypeError):
+
+        MTCQuarterFrame(3, 5)
+
+
+def test_set_tempo():
+    """
+    Tests getting the tempo in microseconds per quarter note.
+    """
+
+    assert SetTempo(0x07, 0xA1, 0x20).tempo == 500000
+
+
+def test_meta_text():
+    """
+    Tests getting and setting text.
+    """
+
+    event = MetaText(*'hello'.encode())
+
+    assert event.text == 'hello'
+
+    event.text = 'café'
+
+    assert event.data == tuple('café'.encode())
+    assert event.text == 'café'
+
+    # Invalid UTF-8 falls back to latin-1:
+
+    assert MetaText(0xE9).text == 'é'
+
+
+def test_decode_batch():
+    """
+    Tests that decoding many events matches decoding them one at a time.
+    """
+
+    events = [Lyric(*'la'.encode()), Lyric(), Lyric(*'café'.encode()), Lyric(0xE9), Lyric(0x61, 0x00, 0x62)]
+
+    assert MetaText.decode_batch(events) == [event.text for event in events]
+    assert MetaText.decode_batch(events[:3]) == ['la', '', 'café']
+    assert MetaText.decode_batch([]) == []
+
+
+def all_events(event=BaseEvent):
+    """
+    Gets the given event class and all of its subclasses.
+    """
+
+    yield event
+
+    for sub in event.__subclasses__():
+
+        yield from all_events(sub)
+
+
+def test_unknown_meta_timing():
+    """
+    Tests that timing values can be set on unknown meta events.
+    """
+
+    decoder = MetaDecoder()
+    decoder.load_default()
+
+    event = decoder.decode(bytes([0xFF, 0x60, 2, 1, 2]))
+
+    assert isinstance(event, UnknownMetaEvent)
+    assert (event.event_type, event.data) == (0x60, (1, 2))
+
+    event.delta = 5
+    event.tick = 10
+    event.time = 20
+    event.delta_time = 30
+
+    assert (event.delta, event.tick, event.time, event.delta_time) == (5, 10, 20, 30)
+    assert UnknownMetaEvent(0xFF, 0x60).delta == 0
+
+
+@pytest.mark.parametrize('event', [event for event in all_events() if not event.__subclasses__()], ids=lambda event: event.__name__)
+def test_event_dict(event):
+    """
+    Tests that every event class keeps a __dict__,
+    so timing values and handler attributes can be attached.
+    """
+
+    assert any('__dict__' in vars(base) for base in event.__mro__)
@@ -0,0 +1,193 @@
+"""
+Tests for the yap-midi handler collection.
+"""
+
+import asyncio
+
+from ymidi.handlers.base import HandlerCollection, MetaHandler
+from ymidi.events.voice import NoteOff, NoteOn
+
+
+class RecordMeta(MetaHandler):
+    """
+    Meta handler that records the events it sees.
+    """
+
+    def __init__(self, tag, seen, drop=False, **kwargs):
+
+        super().__init__(**kwargs)
+
+        self.tag = tag
+        self.seen = seen
+        self.drop = drop
+
+    async def handle(self, event):
+
+        self.seen.append((self.tag, type(event).__name__))
+
+        return None if self.drop else event
+
+
+def run(func):
+    """
+    Runs the given coroutine function with a new HandlerCollection.
+    """
+
+    async def main():
+
+        return await func(HandlerCollection())
+
+    return asyncio.run(main())
+
+
+def test_no_handlers():
+    """
+    Tests that looking up events without handlers does not alter the mappings.
+    """
+
+    async def main(hands):
+
+        await hands.submit(NoteOn(1, 2))
+
+        return hands
+
+    hands = run(main)
+
+    assert not hands.meta_map and not hands.handler_map and not hands.alt_maps
+
+
+def test_global_meta():
+    """
+    Tests that global meta handlers run for every event, in order of priority.
+    """
+
+    async def main(hands):
+
+        seen = []
+
+        hands.load_meta(RecordMeta('global', seen, priority=10), HandlerCollection.GLOBAL_EVENT)
+        hands.load_meta(RecordMeta('note', seen, priority=1), NoteOn.statusmsg)
+
+        await hands.submit(NoteOn(1, 2))
+        await hands.submit(NoteOff(1, 2))
+
+        return seen
+
+    assert run(main) == [('note', 'NoteOn'), ('global', 'NoteOn'), ('global', 'NoteOff')]
+
+
+def test_meta_drop():
+    """
+    Tests that events dropped by a meta handler are not handled.
+    """
+
+    async def main(hands):
+
+        seen = []
+        handled = []
+
+        async def record(hand, event):
+
+            handled.append(event)
+
+        hands.load_meta(RecordMeta('drop', seen, drop=True, priority=1), NoteOn.statusmsg)
+        hands.load_meta(RecordMeta('after', seen, priority=2), NoteOn.statusmsg)
+        hands.callback(record, HandlerCollection.GLOBAL_EVENT)
+
+        await hands.submit(NoteOn(1, 2))
+
+        return seen, handled
+
+    assert run(main) == ([('drop', 'NoteOn')], [])
+
+
+def test_callback():
+    """
+    Tests that callbacks receive the handler, the event and the extra arguments.
+    """
+
+    async def main(hands):
+
+        handled = []
+
+        async def record(hand, event, *args):
+
+            handled.append((hand, event, args))
+
+        hands.callback(record, HandlerCollection.GLOBAL_EVENT, args=['global'])
+        hands.callback(record, NoteOn.statusmsg, args=['note', 5])
+
+        event = NoteOn(1, 2)
+
+        await hands.submit(event)
+        await hands.submit(NoteOff(1, 2))
+
+        return hands, event, handled
+
+    hands, event, handled = run(main)
+
+    assert sorted(args for _, _, args in handled) == [('global',), ('global',), ('note', 5)]
+    assert all(hand.collection is hands for hand, _, _ in handled)
+    assert [item for item in handled if item[2] == ('note', 5)][0][1] is event
+
+
+def test_cache_invalidation():
+    """
+    Tests that handlers loaded after an event was handled are used.
+    """
+
+    async def main(hands):
+
+        seen = []
+        handled = []
+
+        async def record(hand, event, tag):
+
+            handled.append(tag)
+
+        hands.callback(record, NoteOn.statusmsg, args=['first'])
+
+        await hands.submit(NoteOn(1, 2))
+
+        hands.callback(record, HandlerCollection.GLOBAL_EVENT, args=['second'])
+        hands.load_meta(RecordMeta('meta', seen), HandlerCollection.GLOBAL_EVENT)
+
+        await hands.submit(NoteOn(1, 2))
+
+        return seen, handled
+
+    seen, handled = run(main)
+
+    assert seen == [('meta', 'NoteOn')]
+    assert handled[0] == 'first' and sorted(handled[1:]) == ['first', 'second']
+
+
+def test_map_temp():
+    """
+    Tests that temporary maps only apply to the mapped event instance.
+    """
+
+    async def main(hands):
+
+        handled = []
+
+        async def record(hand, event):
+
+            handled.append(event)
+
+        hands.callback(record, 'custom')
+
+        first = NoteOn(1, 2)
+        second = NoteOn(1, 2)
+
+        hands.map_temp(first, 'custom')
+
+        await hands.submit(first)
+        await hands.submit(second)
+        await hands.submit(first)
+
+        return first, handled
+
+    first, handled = run(main)
+
+    assert len(handled) == 1 and handled[0] is first
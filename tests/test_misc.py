@@ -0,0 +1,112 @@
+"""
+Tests for the yap-midi varlen helpers.
+"""
+
+import asyncio
+
+import pytest
+
+from ymidi.errors import DecodeException
+from ymidi.misc import aread_varlen, read_varlen, write_varlen, write_varlen_into
+
+# Example values from the MIDI file specification:
+
+VARLENS = [(0x00, b'\x00'), (0x40, b'\x40'), (0x7F, b'\x7f'), (0x80, b'\x81\x00'), (0x2000, b'\xc0\x00'), (0x3FFF, b'\xff\x7f'), (0x4000, b'\x81\x80\x00'), (0x100000, b'\xc0\x80\x00'), (0x1FFFFF, b'\xff\xff\x7f'), (0x200000, b'\x81\x80\x80\x00'), (0x8000000, b'\xc0\x80\x80\x00'), (0xFFFFFFF, b'\xff\xff\xff\x7f')]
+
+
+class FakeProtocol(object):
+    """
+    Protocol that reads from the given bytes.
+    """
+
+    def __init__(self, bts):
+
+        self.bts = bts
+        self.index = 0
+
+    async def read(self, num):
+
+        data = self.bts[self.index:self.index + num]
+
+        self.index += num
+
+        return data
+
+
+@pytest.mark.parametrize('num,bts', VARLENS)
+def test_write_varlen(num, bts):
+    """
+    Tests encoding varlens.
+    """
+
+    assert write_varlen(num) == bts
+
+    buf = bytearray(b'\x90')
+
+    assert write_varlen_into(buf, num) == len(bts)
+    assert buf == b'\x90' + bts
+
+
+@pytest.mark.parametrize('num', [-1, 0x10000000])
+def test_write_varlen_range(num):
+    """
+    Tests that values outside of the varlen range raise ValueError.
+    """
+
+    with pytest.raises(ValueError):
+
+        write_varlen(num)
+
+
+@pytest.mark.parametrize('num,bts', VARLENS)
+def test_read_varlen(num, bts):
+    """
+    Tests decoding varlens, with extra bytes before and after.
+    """
+
+    assert read_varlen(bts) == (num, len(bts))
+    assert read_varlen(b'\x90\x81' + bts + b'\xff\x00', 2) == (num, len(bts))
+
+
+@pytest.mark.parametrize('bts', [b'', b'\x81', b'\x81\x80\x80', b'\x81\x80\x80\x80\x00'])
+def test_read_varlen_invalid(bts):
+    """
+    Tests that incomplete and overlong varlens raise DecodeException.
+    """
+
+    with pytest.raises(DecodeException):
+
+        read_varlen(bts)
+
+
+@pytest.mark.parametrize('num,bts', VARLENS)
+def test_aread_varlen(num, bts):
+    """
+    Tests decoding varlens from a protocol object.
+    """
+
+    assert asyncio.run(aread_varlen(FakeProtocol(bts + b'\x01'))) == (num, len(bts))
+
+
+def test_aread_varlen_incomplete():
+    """
+    Tests that running out of data raises DecodeException.
+    """
+
+    with pytest.raises(DecodeException):
+
+        asyncio.run(aread_varlen(FakeProtocol(b'\x81\x80')))
+
+
+def test_aread_varlen_too_long():
+    """
+    Tests that varlens longer than 4 bytes raise DecodeException without reading further.
+    """
+
+    proto = FakeProtocol(b'\x81\x80\x80\x80\x80\x80\x00')
+
+    with pytest.raises(DecodeException):
+
+        asyncio.run(aread_varlen(proto))
+
+    assert proto.index == 4
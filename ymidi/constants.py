@@ -4,6 +4,14 @@ This file contains various constants in use by yap-midi.
 
 MAX_INT_VALUE = 128
 
+# --== Event Kinds: ==--
+# Used by decoders to quickly identify what kind of event they are working with
+
+KIND_NORMAL = 0
+KIND_META = 1
+KIND_SYSEX = 2
+KIND_EOX = 3
+
 # -----------------------
 #  MIDI Event Constants:
 # -----------------------
@@ -50,8 +58,9 @@ EXCLUSIVE = (SYSTEM_EXCLUSIVE,)
 
 # --== System Common: ==--
 
+MTC_QUARTER_FRAME = 0xF1
 SONG_POSITION_POINTER = 0xF2
-SONG_SELECT = 0xF2
+SONG_SELECT = 0xF3
 TUNE_REQUEST = 0xF6
 EOX = 0xF7
 
@@ -17,19 +17,260 @@ I need to make a decision on weather these decoder objects will accepts ints or
 Research is necessary, but right now I am leaning more towards the int method.
 """
 
+import re
 import struct
 
-from typing import Any, List, Union, Dict, Tuple
-from collections import defaultdict
+from array import array
+from typing import Any, AsyncIterator, Callable, Iterable, List, Type, Union, Dict, Tuple
+from concurrent.futures import Executor
 
-from ymidi.events.base import BaseEvent, BaseMetaMessage
+from ymidi.events.base import BaseEvent, BaseMetaMessage, RealTimeMessage, _BYTES
 from ymidi.events.builtin import UnknownEvent, UnknownMetaEvent
 from ymidi.events.voice import VOICE_EVENTS
 from ymidi.events.system.realtime import REALTIME_EVENTS
 from ymidi.events.system.common import SYSTEM_COMMON_EVENTS
 from ymidi.events.system.system_exc import SYSTEM_EXCLUSIVE_EVENTS
 from ymidi.events.meta import META_EVENTS
-from ymidi.constants import META, SYSTEM_EXCLUSIVE, EOX, UNKNOWN_META
+from ymidi.constants import META, SYSTEM_EXCLUSIVE, EOX, KIND_META, KIND_SYSEX, KIND_EOX
+from ymidi.misc import write_varlen, write_varlen_into, read_varlen
+from ymidi.errors import DecodeException
+
+# Length table values for events without a fixed length:
+
+VARIABLE_LENGTH = 0xFF
+UNKNOWN_LENGTH = 0xFE
+
+# Matches any status byte, used to find the end of unknown events:
+
+_STATUS_BYTE = re.compile(b'[\x80-\xff]')
+
+# Matches the status messages that start meta and system exclusive events in MIDI files:
+
+_META_START = re.compile(b'[\xf0\xf7\xff]')
+
+# Precompiled packers for short events, indexed by the number of data bytes:
+
+_PACKERS = tuple(struct.Struct('{}B'.format(count + 1)).pack_into for count in range(4))
+
+
+def _make_decoders(event: Type[BaseEvent]) -> List[Union[Callable[[bytes, int], BaseEvent], None]]:
+    """
+    Generates decode functions specialized for the given event.
+
+    Because the length and channel info of an event is known
+    when the event is loaded, we can generate a function
+    that pulls exactly the right bytes and creates the event,
+    without checking any of these values at decode time.
+
+    Channel events get one function for each of the 16 channels,
+    with the channel bound to the function.
+    All other events get a single function.
+    The source is only compiled once per event,
+    each function is created by a factory we generate.
+
+    The generated functions take the bytes to decode
+    and the index of the first data byte.
+    They return the final event.
+
+    Variable length and unknown events can't be specialized,
+    so we return None for these events.
+
+    :param event: Event to generate decoders for
+    :type event: Type[BaseEvent]
+    :return: Specialized decode functions, one per status message of the event
+    :rtype: List[Union[Callable[[bytes, int], BaseEvent], None]]
+    """
+
+    count = 16 if event.has_channel else 1
+
+    if event.length < 0 or event is UnknownEvent:
+
+        # Can't specialize this event, use the generic path:
+
+        return [None] * count
+
+    # Build the source of the factory:
+
+    args = ", ".join("bts[start + {}]".format(index) for index in range(event.length))
+
+    source = ["def factory(channel):", "    def decode(bts, start):", "        final = event({})".format(args)]
+
+    if event.has_channel:
+
+        # Attach channel data:
+
+        source.append("        final.channel = channel")
+
+    source.extend(("        return final", "    return decode"))
+
+    # Compile the factory with the event bound to it:
+
+    namespace = {"event": event}
+
+    exec("\n".join(source), namespace)
+
+    factory = namespace["factory"]
+
+    return [factory(channel) for channel in range(count)]
+
+
+def _shared_decoder(final: BaseEvent) -> Callable[[bytes, int], BaseEvent]:
+    """
+    Generates a decode function that always returns the given event.
+
+    This is used for events that carry no data,
+    where every decoded event would be identical.
+
+    :param final: Event to return
+    :type final: BaseEvent
+    :return: Decode function returning the event
+    :rtype: Callable[[bytes, int], BaseEvent]
+    """
+
+    def decode(bts, start):
+
+        return final
+
+    return decode
+
+
+def _end_status(event: Type[BaseEvent]) -> int:
+    """
+    Gets the status message that ends the given event.
+
+    Only variable length events have an end event,
+    so we return -1 for all other events.
+
+    :param event: Event to get the end status message of
+    :type event: Type[BaseEvent]
+    :return: Status message of the end event, -1 if there is none
+    :rtype: int
+    """
+
+    if event.length == -1:
+
+        return event.end.statusmsg
+
+    return -1
+
+
+def _table_length(event: Type[BaseEvent]) -> int:
+    """
+    Gets the length of the given event as stored in the length table.
+
+    Variable length events are stored as VARIABLE_LENGTH.
+
+    :param event: Event to get the length of
+    :type event: Type[BaseEvent]
+    :return: Length of the event
+    :rtype: int
+    """
+
+    if event.length == -1:
+
+        return VARIABLE_LENGTH
+
+    return event.length
+
+
+def _seq_handler(event: Type[BaseEvent]) -> Callable[[Any, int], Union[None, BaseEvent]]:
+    """
+    Gets the sequential decoding handler for the given event.
+
+    Zero length events interrupt the data flow,
+    so they get a special handler.
+
+    :param event: Event to get the handler for
+    :type event: Type[BaseEvent]
+    :return: Sequential decoding handler
+    :rtype: Callable[[ModularDecoder, int], Union[None, BaseEvent]]
+    """
+
+    if event.length == 0:
+
+        return ModularDecoder._seq_interrupt
+
+    return ModularDecoder._seq_status
+
+
+# Events loaded by default:
+
+DEFAULT_EVENTS = VOICE_EVENTS + REALTIME_EVENTS + SYSTEM_COMMON_EVENTS + SYSTEM_EXCLUSIVE_EVENTS
+
+# Frozen tables of the default events, built the first time they are loaded:
+
+_DEFAULT_TABLES: Union[Tuple, None] = None
+
+
+def _default_tables() -> Tuple[Tuple[int, ...], Tuple[tuple, ...]]:
+    """
+    Gets the frozen tables of the default events.
+
+    The tables are built the first time this function is called,
+    and are reused afterwards.
+    We return the status messages occupied by the default events,
+    and a frozen copy of each table indexed by status message.
+
+    :return: Default status messages, and the frozen tables
+    :rtype: Tuple[Tuple[int, ...], Tuple[tuple, ...]]
+    """
+
+    global _DEFAULT_TABLES
+
+    if _DEFAULT_TABLES is None:
+
+        # Build the default tables and freeze them:
+
+        decoder = ModularDecoder()
+
+        for event in DEFAULT_EVENTS:
+
+            decoder.load_event(event)
+
+        statuses = tuple(status for status, event in enumerate(decoder._status_table) if event is not None)
+
+        _DEFAULT_TABLES = statuses, tuple(tuple(table) for table in decoder._tables())
+
+    return _DEFAULT_TABLES
+
+
+def _rebuild_decoder(decoder_type: Type['ModularDecoder'], events: Tuple[Type[BaseEvent], ...], shared: bool) -> 'ModularDecoder':
+    """
+    Rebuilds a pickled decoder by loading the given events.
+
+    If the events are the default events of the decoder,
+    then we load the defaults, which copies the frozen default tables
+    instead of generating the decode functions again.
+
+    :param decoder_type: Type of decoder to create
+    :type decoder_type: Type[ModularDecoder]
+    :param events: Events the decoder had loaded, in load order
+    :type events: Tuple[Type[BaseEvent], ...]
+    :param shared: Whether real time events were shared
+    :type shared: bool
+    :return: Rebuilt decoder
+    :rtype: ModularDecoder
+    """
+
+    decoder = decoder_type()
+
+    decoder.load_default()
+
+    if decoder._loaded_events() != events:
+
+        # Not the default events, load each of them:
+
+        decoder = decoder_type()
+
+        for event in events:
+
+            decoder.load_event(event)
+
+    if shared:
+
+        decoder.share_realtime()
+
+    return decoder
 
 
 class BaseDecoder(object):
@@ -79,7 +320,7 @@ class BaseDecoder(object):
 
         raise NotImplementedError("Must be overridden in child class!")
 
-    def seq_decode(self, byte: bytes) -> Union[None, BaseEvent]:
+    def seq_decode(self, byte: int) -> Union[None, BaseEvent]:
         """
         Sequentially decodes the given bytes.
 
@@ -88,15 +329,15 @@ class BaseDecoder(object):
         Once the decoding operation is complete,
         then this method will return the event generated from the bytes.
 
-        :param byte: Bytes to work with
-        :type byte: bytes
+        :param byte: Byte to work with
+        :type byte: int
         :return: None if more bytes needed, BaseEvent when decoding operation is complete
         :rtype: Union[None, BaseEvent]
         """
 
         raise NotImplementedError("Must be overridden in child class!")
 
-    def reset(self):
+    def reset(self) -> None:
         """
         Resets the state of this decoder.
 
@@ -121,7 +362,7 @@ class BaseDecoder(object):
 
         # Convert to bytes and return:
 
-        return struct.pack(">B", num)
+        return _BYTES[num]
 
     def to_int(self, bts: bytes) -> int:
         """
@@ -135,30 +376,32 @@ class BaseDecoder(object):
         :rtype: int
         """
 
-        return struct.unpack(">B", bts)[0]
+        return bts[0]
 
     def is_status(self, num: int) -> bool:
         """
         Determines if this bit is a status byte.
 
-        A status byte will always be between 128-255.
+        A status byte will always be between 128-255,
+        meaning the top bit is always set.
         We return True if the byte is a status byte.
 
-        :param int: Int to check
-        :type int: [type]
+        :param num: Int to check
+        :type num: int
         :return: True if status byte, False if not
         :rtype: bool
         """
 
         # Determine status byte and return:
 
-        return 128 <= num <= 255
+        return num & 0x80 != 0
 
     def is_data(self, num: int) -> bool:
         """
         Determines if this bit is a data byte.
 
-        A data byte will always be between 0-127.
+        A data byte will always be between 0-127,
+        meaning the top bit is never set.
         We return True if the byte is a data byte.
 
         :param num: Int to check
@@ -167,7 +410,7 @@ class BaseDecoder(object):
         :rtype: bool
         """
 
-        return 0 <= num <= 127
+        return num & 0x80 == 0
 
 
 class ModularDecoder(BaseDecoder):
@@ -210,9 +453,10 @@ class ModularDecoder(BaseDecoder):
     so the decoder can work with custom user events,
     given the follow the rules outlined here.
 
-    The collection is essentially a dictionary of valid events.
-    The key is the status message of the event,
-    while the value is the event class to use while generating. 
+    The collection is essentially a table of valid events.
+    The index is the status message of the event,
+    while the value is the event class to use while generating.
+    The 'collection' property offers a dictionary view of this table.
 
     This decoder can either be used as an incremental decoder,
     or as an instant decoder.
@@ -225,34 +469,137 @@ class ModularDecoder(BaseDecoder):
     def __init__(self) -> None:
         super().__init__()
 
-        self.collection: Dict[int, Any] = {}  # Collection of events
-        self.decode_status = []  # Status message of the last event decoded
+        self._status_table: List[Union[Type[BaseEvent], None]] = [None] * 256  # Collection of events, indexed by status message
+        self._decoders: List[Union[Callable[[bytes, int], BaseEvent], None]] = [None] * 256  # Specialized decode functions, indexed by status message
+        self._end_table: List[int] = [-1] * 256  # End status message of variable length events, indexed by status message
+        self._length_table = bytearray([UNKNOWN_LENGTH]) * 256  # Length of events, indexed by status message
+        self._info_table: List[Union[Tuple[Type[BaseEvent], bool, int], None]] = [None] * 256  # Event, channel info, and end status message, indexed by status message
+        self._seq_table: List[Callable[[ModularDecoder, int], Union[None, BaseEvent]]] = [ModularDecoder._seq_data] * 128 + [ModularDecoder._seq_status] * 128  # Sequential decoding handlers, indexed by byte
+        self.running_status = 0  # Status message of the last event decoded, 0 if none
         self.encode_status = []  # Status message of the last event encoded
+        self._shared_realtime = False  # Value determining if real time events are shared
 
         # --== Sequential Decoding State: ==--
 
-        self.data = []  # Data we are currently working with
-        self.event = []  # Event instances to work with
+        self._buf = bytearray()  # Bytes of the event we are currently working with
+        self._status = 0  # Status message we are currently working with, 0 if none
 
-    def load_default(self):
+        self._stack: List[Tuple[bytearray, int]] = []  # Buffer and status message of interrupted events, most recent last
+        self._spare: List[bytearray] = []  # Cleared buffers, ready to be reused
+        self.nest_limit: Union[int, None] = None  # Maximum number of interrupted events to hold, None for no limit
+
+    def load_default(self) -> None:
         """
         Loads the default events into our collection.
 
-        We simply import the relevant events
-        and add it to the collection.
+        The default events never change,
+        so the tables for them are only built once,
+        the first time any decoder loads them.
+        We then simply copy the default entries into our tables,
+        instead of loading (and generating decoders for) each event again.
+        """
+
+        self._copy_defaults(_default_tables()[0])
+
+    def _copy_defaults(self, statuses: Iterable[int]) -> None:
         """
+        Copies the entries of the default events into our tables.
 
-        events = VOICE_EVENTS + REALTIME_EVENTS + SYSTEM_COMMON_EVENTS + SYSTEM_EXCLUSIVE_EVENTS
+        Only the entries for the given status messages are copied,
+        which allows a subset of the default events to be loaded.
 
-        # Iterate over all events in yap-midi:
+        :param statuses: Status messages to copy
+        :type statuses: Iterable[int]
+        """
 
-        for event in events:
+        statuses = tuple(statuses)
+        defaults = _default_tables()[1]
 
-            # Add the event to the collection:
+        # Copy the default entries into our tables:
 
-            self.load_event(event)
+        for table, default in zip(self._tables(), defaults):
+
+            for status in statuses:
+
+                table[status] = default[status]
+
+    def share_realtime(self) -> None:
+        """
+        Makes real time events decode into a single shared instance.
+
+        Real time events carry no data and are sent very often,
+        such as the TimingClock that is sent many times per beat.
+        Once this method is called, each loaded real time event
+        is only created once, and that same instance is returned
+        every time the event is decoded, by all decoding methods.
+
+        Because the instance is shared, it should NOT be altered!
+        Components that attach values to events,
+        such as the track handlers that calculate timing,
+        will give wrong results with shared events.
+
+        This only affects real time events that are currently loaded,
+        so this method should be called after loading events.
+        """
+
+        self._shared_realtime = True
+
+        for status in range(0xF8, 0x100):
+
+            event = self._status_table[status]
+
+            if event is not None and issubclass(event, RealTimeMessage) and event.length == 0:
+
+                self._decoders[status] = _shared_decoder(event())
+
+    def _tables(self) -> Tuple[list, list, list, bytearray, list, list]:
+        """
+        Gets all of the tables that are indexed by status message.
+
+        :return: Each table indexed by status message
+        :rtype: Tuple[list, list, list, bytearray, list, list]
+        """
+
+        return self._status_table, self._decoders, self._end_table, self._length_table, self._info_table, self._seq_table
+
+    def _loaded_events(self) -> Tuple[Type[BaseEvent], ...]:
+        """
+        Gets each event we have loaded, in an order that can be loaded again.
+
+        Channel events occupy 16 status messages at once,
+        so they come first.
+        Any other event that replaced one of their status messages
+        is then loaded on top of them, which rebuilds the same tables.
+
+        :return: Loaded events
+        :rtype: Tuple[Type[BaseEvent], ...]
+        """
+
+        events = [event for event in dict.fromkeys(self._status_table) if event is not None]
+
+        return tuple(sorted(events, key=lambda event: not event.has_channel))
+
+    def __reduce__(self) -> tuple:
+        """
+        Gets the info needed to pickle this decoder.
 
-    def load_event(self, event: BaseEvent):
+        Our decode functions are generated at runtime,
+        so they can't be pickled.
+        Instead, we pickle the events we have loaded,
+        and the decoder is rebuilt by loading them again.
+        This allows decoders to be sent to other processes,
+        such as the workers of a ProcessPoolExecutor.
+
+        Only the loaded events and our settings are kept,
+        the state of any decoding operation is NOT.
+
+        :return: Function to rebuild this decoder, and its arguments and state
+        :rtype: tuple
+        """
+
+        return _rebuild_decoder, (type(self), self._loaded_events(), self._shared_realtime), {'nest_limit': self.nest_limit}
+
+    def load_event(self, event: Type[BaseEvent]) -> None:
         """
         Loads the given event to the collection.
         
@@ -261,7 +608,7 @@ class ModularDecoder(BaseDecoder):
         and the we register it for use.
 
         :param event: Event to register
-        :type event: BaseEvent
+        :type event: Type[BaseEvent]
         """
 
         if not issubclass(event, BaseEvent):
@@ -270,19 +617,46 @@ class ModularDecoder(BaseDecoder):
 
             raise ValueError("Event does not inherit BaseEvent!")
 
+        # Determine the status messages this event occupies:
+
+        count = 1
+        base = event.statusmsg
+
         if event.has_channel:
-            
-            # Encode channel info into the event:
-            
-            for item in range(0,16):
-                
-                self.collection[event.statusmsg & 0xF0 | item] = event
 
-        # Add the event:
+            # Encode channel info into the event, all 16 channels at once:
 
-        else:
+            count = 16
+            base = base & 0xF0
+
+        span = slice(base, base + count)
+
+        # Add the event to each table:
+
+        self._status_table[span] = [event] * count
+        self._decoders[span] = _make_decoders(event)
+        self._end_table[span] = [_end_status(event)] * count
+        self._length_table[span] = bytes((_table_length(event),)) * count
+        self._info_table[span] = [(event, event.has_channel, _end_status(event))] * count
+        self._seq_table[span] = [_seq_handler(event)] * count
+
+    @property
+    def collection(self) -> Dict[int, Type[BaseEvent]]:
+        """
+        Gets the collection of events we are working with.
+
+        Events are stored internally in a table of 256 slots,
+        one for each status message.
+        This property builds a dictionary view of that table,
+        mapping each loaded status message to it's event.
+        Altering the returned dictionary will NOT alter this decoder,
+        use load_event() for that!
+
+        :return: Dictionary mapping status messages to events
+        :rtype: Dict[int, Type[BaseEvent]]
+        """
 
-            self.collection[event.statusmsg] = event
+        return {status: event for status, event in enumerate(self._status_table) if event is not None}
 
     def get_length(self, status: int) -> int:
         """
@@ -296,7 +670,17 @@ class ModularDecoder(BaseDecoder):
         :rtype: int 
         """
 
-        return self.collection[status].length
+        length = self._length_table[status]
+
+        if length == VARIABLE_LENGTH:
+
+            return -1
+
+        if length == UNKNOWN_LENGTH:
+
+            raise DecodeException("Unknown status message: {}".format(status))
+
+        return length
 
     def get_running(self) -> int:
         """
@@ -308,7 +692,7 @@ class ModularDecoder(BaseDecoder):
         :rtype: int
         """
 
-        return self.decode_status[0]
+        return self.running_status
 
     def decode(self, bts: bytes) -> BaseEvent:
         """
@@ -325,264 +709,1237 @@ class ModularDecoder(BaseDecoder):
         This also means this method will be faster than sequential decoding!
         TODO: Confirm this and backup with some numbers
 
+        The length of the given bytes is not checked up front.
+        Missing data bytes are only detected when creating the event fails,
+        so correctly sized bytes pay nothing for the check.
+
         :param bytes: Bytes to decode
         :type bytes: bytes
         :return: Event representing the bytes
         :rtype: BaseEvent
+        :raises: DecodeException: If the bytes are malformed or incomplete
         """
 
         # Determine if we are working with a new event:
 
-        if self.is_status(bts[0]):
+        start = 0
+
+        if bts[0] & 0x80:
 
             # Working with a new event! Set our current status:
 
-            self.decode_status.insert(0, bts[0])
+            self.running_status = bts[0]
 
-        # Get the event we are working with:
+            start = 1
+
+        elif not self.running_status:
+
+            # No status message and no running status, nothing we can do:
+
+            raise DecodeException("No status message given, and no running status to use!")
+
+        status = self.running_status
+
+        # Use the specialized decoder if we have one:
+
+        func = self._decoders[status]
+
+        if func is not None:
 
-        event = self.collection[self.decode_status[0]]
+            try:
 
-        # Decode the values:
+                return func(bts, start)
 
-        val = bts[1:]
+            except IndexError:
+
+                # Not enough data bytes, only checked when decoding fails:
+
+                raise DecodeException("Event {} needs {} data bytes, but only {} were given!".format(self._status_table[status].name, self._length_table[status], len(bts) - start)) from None
+
+        # Get the event we are working with:
+
+        info = self._info_table[status]
 
         # Determine if event is Unknown:
 
-        if event is UnknownEvent:
+        if info is None:
+
+            # Pass the status message along with the data:
 
-            # Add status message to the start of data:
+            return UnknownEvent(status, *memoryview(bts)[start:])
 
-            val.insert(0, self.decode_status[0])
+        event, has_channel, end = info
+        stop = len(bts)
 
         # Are we a variable length event?
 
-        if event.length == -1:
+        if end != -1:
 
-            # Ensure the last value is the end event:
+            # Ensure the last value is the end event, and leave it out:
 
-            assert val[-1] == event.end.statusmsg
+            stop -= 1
 
-            # Remove the last data value:
+            if stop < start or bts[stop] != end:
 
-            val.pop(-1)
+                raise DecodeException("Variable length event {} does not end with {}!".format(event.name, end))
 
-        # Create the event:
+        # Create the event from a view of the values, no need to copy them:
 
-        final = event(*val)
+        view = memoryview(bts)[start:stop]
+
+        final = event.frombytes(view) if event.KIND == KIND_SYSEX else event(*view)
 
         # Determine if event is channel message:
 
-        if final.has_channel:
+        if has_channel:
 
             # Attach channel data:
 
-            final.channel = self.decode_status[0] & 0x0F
+            final.channel = status & 0x0F
 
         # Return the final event:
 
         return final
 
-    def seq_decode(self, bts: bytes) -> Union[None, BaseEvent]:
+    def decode_tracks(self, tracks: Iterable[bytes], executor: Union[Executor, None] = None) -> List[List[BaseEvent]]:
+        """
+        Decodes each of the given tracks into a list of events.
+
+        Each track is a series of bytes containing MIDI events,
+        and each track is decoded independently of the others,
+        meaning that running status does NOT carry over between tracks.
+        We return a list of decoded events for each track,
+        in the order the tracks were given.
+
+        Because tracks are independent,
+        they can be decoded at the same time.
+        If an executor is provided,
+        then each track will be submitted to it.
+        Otherwise, the tracks are decoded one after another.
+        Decoding is pure python, so only a ProcessPoolExecutor
+        will decode the tracks in parallel.
+        This decoder is pickled and rebuilt in the worker processes,
+        so any custom events must be importable by them.
+
+        Like decode(), this method does NOT support MIDI event interruption.
+        Decoding the tracks does not alter the state of this decoder.
+
+        :param tracks: Tracks to decode
+        :type tracks: Iterable[bytes]
+        :param executor: Executor to decode the tracks with, defaults to None
+        :type executor: Executor, optional
+        :return: List of decoded events for each track
+        :rtype: List[List[BaseEvent]]
         """
-        Sequentially decodes the given bytes.
 
-        This method processes individual bytes in a sequence,
-        which is great if you don't know the length of your events,
-        or you can't structure your bytes.
+        if executor is None:
 
-        This method returns None when more bytes are required to decode,
-        and returns the final event when the decoding operation is completed.
+            return [self.decode_stream(track) for track in tracks]
 
-        Event interruption is supported in this method!
-        If you are unsure if out of place MIDI events will interrupt the stream,
-        then you should use this method to sort out the chaos.
+        return list(executor.map(self.decode_stream, tracks))
 
-        :param byte: Byte to decode
-        :type byte: bytes
-        :return: None if more bytes are required, event if operation is completed
-        :rtype: Union[None, BaseEvent]
+    def decode_stream(self, bts: bytes) -> List[BaseEvent]:
         """
+        Decodes ALL events in the given bytes.
+
+        This is much faster than calling decode() for each event,
+        as we only need to find the boundaries of each event,
+        which we get from our length table.
+        We walk the bytes one event at a time,
+        using running status when the status message is not provided.
+        Unknown events will continue until the next status message.
+
+        Like decode(), this method does NOT support MIDI event interruption,
+        so the bytes should be structured and organized correctly.
+        The bytes must start with a status message,
+        as there is no running status to use.
+        Data bytes following an event without data,
+        such as a TimingClock, raise a DecodeException,
+        as they can't belong to any event.
+
+        The data of variable length and unknown events is read
+        through a memoryview, so it is not copied before
+        being passed to the event.
+
+        We keep our state in local variables,
+        so this method does not alter the state of this decoder,
+        and can be called from multiple threads at once.
 
-        num = bts
-        done = False
+        :param bts: Bytes to decode
+        :type bts: bytes
+        :return: List of decoded events
+        :rtype: List[BaseEvent]
+        :raises: DecodeException: If the bytes are malformed or incomplete
+        """
 
-        # Determine if we are working with a status byte:
+        decoders = self._decoders
+        lengths = self._length_table
+        info = self._info_table
 
-        if self.is_status(num):
+        view = memoryview(bts)
 
-            # Get the event:
+        final = []
+        append = final.append
+        status = 0
+        index = 0
+        size = len(bts)
 
-            event = self.collection[num]
+        if size and not bts[0] & 0x80:
 
-            # Check if the event is end of variable length sequence, or coming after an unknown event:
+            # No status message and no running status, nothing we can do:
 
-            if self.event and ((self.event[0].length == -1 and self.event[0].end.statusmsg == num) or self.event[0] is UnknownEvent):
+            raise DecodeException("No status message given, and no running status to use!")
 
-                # We came to the end of the sequence, exit time:
+        try:
 
-                done = True
-                
-                # Add the end event to the data:
+            while index < size:
 
-                self.data[0].append(bts)
+                # Determine if we are working with a new event:
 
-            else:
+                if bts[index] & 0x80:
 
-                # Set some data:
+                    status = bts[index]
+                    index += 1
 
-                self.decode_status.insert(0, num)
-                self.data.insert(0, [bts])
-                self.event.insert(0, event)
+                # Use the specialized decoder if we have one:
 
-        else:
+                func = decoders[status]
 
-            # Add the byte to the data buffer:
+                if func is not None:
 
-            if len(self.data) == 0:
+                    length = lengths[status]
 
-                self.data.insert(0, [bts])
+                    append(func(bts, index))
 
-            else:
+                    index += length
 
-                self.data[0].append(bts)
+                    if not length:
 
-        # Check if the data is ready to return:
+                        # Events without data can't be followed by data bytes:
 
-        if done or (len(self.data[0]) - 1 == self.event[0].length):
+                        if index < size and not bts[index] & 0x80:
 
-            # Decode the event:
+                            raise DecodeException("Data byte {} at index {} follows event {}, which has no data!".format(bts[index], index, self._status_table[status].name))
 
-            event = self.decode(self.data[0])
+                        continue
 
-            # Clear the decoding state:
+                    # Decode any following events that use running status:
 
-            self.data[0].clear()
+                    while index < size and not bts[index] & 0x80:
 
-            # Check if we are a nested event:
+                        append(func(bts, index))
 
-            if len(self.decode_status) > 1:
+                        index += length
 
-                # We have other events to process:
+                    continue
 
-                self.decode_status.pop(0)
-                self.data.pop(0)
-                self.event.pop(0)
+                if lengths[status] == UNKNOWN_LENGTH:
 
-            # Return the event:
+                    # Unknown event, continue until the next status message:
 
-            return event
+                    match = _STATUS_BYTE.search(bts, index)
 
-        # Not done, return None
+                    end = match.start() if match else size
 
-        return None
+                    append(UnknownEvent(status, *view[index:end]))
 
-    def encode(self, event: BaseEvent) -> bytes:
-        """
-        Encodes the given event into bytes.
+                else:
 
-        :param event: Event to encode
-        :type event: BaseEvent
-        :return: Encoded bytes
-        :rtype: bytes
-        """
+                    # Variable length event, continue until the end event:
 
-        # Return the encoded data:
+                    event, has_channel, end_status = info[status]
 
-        return bytes(event)
+                    end = bts.find(end_status, index)
 
+                    if end == -1:
 
-class MetaDecoder(ModularDecoder):
-    """
-    MetaDecoder - Decodes Meta Events present in MIDI files.
-    
-    Because Meta events are specific to MIDI files,
-    and that decoding them is somewhat non-standard,
-    decoding operations for them are placed into a separate class
-    that is only used when necessary.
+                        raise DecodeException("Variable length event {} does not end with {}!".format(event.name, end_status))
 
-    A meta event has a status message of 0xFF,
-    and has a 'type', 'length', and 'bytes' fields.
-    We use these fields to determine the type of event.
+                    temp = event.frombytes(view[index:end]) if event.KIND == KIND_SYSEX else event(*view[index:end])
 
-    From here, it is quite simple as we are given the length of the event,
-    so we just read a specific amount of bytes.
+                    if has_channel:
 
-    This encoder is modular, similar to the ModularDecoder,
-    which allows custom meta events to be registered and loaded for proper decoding.
-    We inherit the ModularDecoder, and use it to decode any non-meta events.
-    """
+                        temp.channel = status & 0x0F
 
-    def __init__(self) -> None:
-        super().__init__()
+                    append(temp)
 
-        self.meta_collection: Dict[int, Any] = defaultdict(self._return_default)  # Collection of meta events
-        self.meta_default = UnknownMetaEvent
+                    # Skip past the end event:
 
-        # --== Context Values: ==--
-        # These values should NOT be access or changed at any point,
-        # As the varlen/sequential decoder relies on these variables!
+                    end += 1
 
-        self.var_value = None  # Current varlen decoded value
-        self.var_byt = None  # Current bytes that we are working with
-        self.var_index = 0  # Number of bytes we have read in varlen decoding
+                index = end
 
-        self.meta_decode = False  # Value determining if we are in the process of decoding a meta event
-        self.meta_length = 0  # Length of the Meta event to decode
-        self.meta_byts = []  # Collection of all meta bytes we are working with
-        self.meta_type = None  # Meta type we are working with
+        except IndexError:
 
-        self.var_final = 0  # Temporary variable-length value to work with
+            # Not enough data bytes for the last event, only checked when decoding fails:
 
-    def _return_default(self):
-        """
-        Simply returns the default value.
-        """
+            raise DecodeException("Event {} needs {} data bytes, but only {} were given!".format(self._status_table[status].name, lengths[status], size - index)) from None
 
-        return self.meta_default
+        return final
 
-    def reset(self):
+    def scan_stream(self, bts: bytes) -> Tuple[List[int], List[int], List[int]]:
         """
-        Resets this decoder back to it's initial state.
-
-        This is useful for recovering from a botched decoding job.
-
-        This method is called automatically after each sequential
-        decoding operation, but it can be called manually when necessary.
+        Finds the boundaries of ALL events in the given bytes,
+        without creating any events.
+
+        We walk the bytes exactly like decode_stream(),
+        but instead of creating each event,
+        we return three lists of equal length:
+        the status message of each event,
+        the index of the first data byte of each event,
+        and the index just past the last data byte of each event.
+        The data of an event can then be retrieved with 'bts[start:stop]'.
+
+        This is useful if only some of the events are relevant,
+        as they can be filtered by status message
+        before paying the cost of creating them.
+
+        Long runs of fixed length events using running status
+        are not walked one event at a time.
+        Once a run is long enough, we find where it ends
+        and compute the boundaries of the remaining events in the run at once.
+
+        :param bts: Bytes to scan
+        :type bts: bytes
+        :return: Status messages, start indexes, and stop indexes of each event
+        :rtype: Tuple[List[int], List[int], List[int]]
+        :raises: DecodeException: If the bytes are malformed or incomplete
         """
 
-        # Reset the context variables:
+        lengths = self._length_table
+        ends = self._end_table
 
-        self.var_value = None
-        self.var_byt = None
-        self.var_index = 0
-        self.var_final = 0
+        statuses = []
+        starts = []
+        stops = []
+        status = 0
+        length = 0
+        run = 0
+        index = 0
+        size = len(bts)
 
-        self.meta_decode = False
-        self.meta_length = 0
-        self.meta_byts = []
-        self.meta_type = None
+        if size and not bts[0] & 0x80:
 
-    def load_default(self):
-        """
-        Loads the default meta-handlers.
-        
-        We also load the default events as specified in the ModularDecoder.
-        """
+            # No status message and no running status, nothing we can do:
 
-        for event in META_EVENTS:
+            raise DecodeException("No status message given, and no running status to use!")
 
-            # Add each meta event:
+        while index < size:
 
-            self.load_event(event)
+            # Determine if we are working with a new event:
 
-        # Also, load the default voice events in the ModularDecoder:
+            if bts[index] & 0x80:
 
-        for event in VOICE_EVENTS:
+                status = bts[index]
+                index += 1
+                run = 0
+
+            else:
+
+                run += 1
+
+                if run == 8 and 0 < length < UNKNOWN_LENGTH:
+
+                    # Long run of fixed length events using running status, find the next status message:
+
+                    match = _STATUS_BYTE.search(bts, index)
+
+                    count = ((match.start() if match else size) - index) // length
+
+                    # Add the rest of the run at once:
+
+                    end = index + count * length
+
+                    statuses.extend([status] * count)
+                    starts.extend(range(index, end, length))
+                    stops.extend(range(index + length, end + length, length))
+
+                    index = end
+
+                    continue
+
+            length = lengths[status]
+
+            if length < UNKNOWN_LENGTH:
+
+                # Fixed length event:
+
+                stop = index + length
+                end = stop
+
+                if stop > size:
+
+                    raise DecodeException("Event {} needs {} data bytes, but only {} were given!".format(self._status_table[status].name, length, size - index))
+
+                if not length and stop < size and not bts[stop] & 0x80:
+
+                    # Events without data can't be followed by data bytes:
+
+                    raise DecodeException("Data byte {} at index {} follows event {}, which has no data!".format(bts[stop], stop, self._status_table[status].name))
+
+            elif length == UNKNOWN_LENGTH:
+
+                # Unknown event, continue until the next status message:
+
+                match = _STATUS_BYTE.search(bts, index)
+
+                stop = match.start() if match else size
+
+                end = stop
+
+            else:
+
+                # Variable length event, continue until the end event:
+
+                stop = bts.find(ends[status], index)
+
+                if stop == -1:
+
+                    raise DecodeException("Variable length event {} does not end with {}!".format(self._status_table[status].name, ends[status]))
+
+                end = stop + 1
+
+            statuses.append(status)
+            starts.append(index)
+            stops.append(stop)
+
+            index = end
+
+        return statuses, starts, stops
+
+    def normalize_running_status(self, bts: bytes) -> bytes:
+        """
+        Adds the status message to each event that uses running status.
+
+        We return bytes where each event begins with it's status message,
+        which removes the need to keep track of running status when decoding.
+        The events are otherwise unaltered.
+        We use scan_stream() to find each event,
+        and copy the data of each event in one operation.
+
+        Like scan_stream(), this method does NOT support MIDI event interruption.
+
+        :param bts: Bytes to normalize
+        :type bts: bytes
+        :return: Bytes with a status message for each event
+        :rtype: bytes
+        """
+
+        return self._join_events(bts, *self.scan_stream(bts))
+
+    def _join_events(self, bts: bytes, statuses: Iterable[int], starts: Iterable[int], stops: Iterable[int]) -> bytes:
+        """
+        Encodes events found by scan_stream() back into bytes.
+
+        Each event is written with it's status message,
+        followed by the data between the start and stop index.
+        Variable length events get their end event added back.
+
+        :param bts: Bytes containing the data of the events
+        :type bts: bytes
+        :param statuses: Status message of each event
+        :type statuses: Iterable[int]
+        :param starts: Index of the first data byte of each event
+        :type starts: Iterable[int]
+        :param stops: Index just past the last data byte of each event
+        :type stops: Iterable[int]
+        :return: Encoded bytes
+        :rtype: bytes
+        """
+
+        ends = self._end_table
+
+        out = bytearray()
+
+        for status, start, stop in zip(statuses, starts, stops):
+
+            out.append(status)
+            out += bts[start:stop]
+
+            if ends[status] != -1:
+
+                # Variable length event, add the end event back:
+
+                out.append(ends[status])
+
+        return bytes(out)
+
+    def decode_track(self, bts: bytes) -> 'DecodedTrack':
+        """
+        Decodes ALL events in the given bytes into a DecodedTrack.
+
+        Instead of creating an object for each event,
+        we only find the boundaries of each event using scan_stream(),
+        and store them in compact arrays.
+        Events are only created when they are accessed.
+        This uses much less memory than decode_stream(),
+        which is useful for very large tracks.
+
+        Like decode_stream(), this method does NOT support MIDI event interruption.
+
+        :param bts: Bytes to decode
+        :type bts: bytes
+        :return: DecodedTrack holding the events
+        :rtype: DecodedTrack
+        """
+
+        statuses, starts, stops = self.scan_stream(bts)
+
+        return DecodedTrack(self, bytearray(bts), bytearray(statuses), array('L', starts), array('L', stops))
+
+    def _make_event(self, status: int, bts: bytes, start: int, stop: int) -> BaseEvent:
+        """
+        Creates an event using the given status message and data.
+
+        The data of the event is the bytes between the start and stop index.
+
+        :param status: Status message of the event
+        :type status: int
+        :param bts: Bytes containing the data of the event
+        :type bts: bytes
+        :param start: Index of the first data byte
+        :type start: int
+        :param stop: Index just past the last data byte
+        :type stop: int
+        :return: Created event
+        :rtype: BaseEvent
+        :raises: DecodeException: If the bytes are incomplete
+        """
+
+        # Use the specialized decoder if we have one:
+
+        func = self._decoders[status]
+
+        if func is not None:
+
+            try:
+
+                return func(bts, start)
+
+            except IndexError:
+
+                # Not enough data bytes, only checked when decoding fails:
+
+                raise DecodeException("Event {} needs {} data bytes, but only {} were given!".format(self._status_table[status].name, self._length_table[status], len(bts) - start)) from None
+
+        info = self._info_table[status]
+
+        if info is None:
+
+            # Unknown event, pass the status message along with the data:
+
+            return UnknownEvent(status, *bts[start:stop])
+
+        event, has_channel, _ = info
+
+        final = event.frombytes(bts[start:stop]) if event.KIND == KIND_SYSEX else event(*bts[start:stop])
+
+        if has_channel:
+
+            final.channel = status & 0x0F
+
+        return final
+
+    def seq_decode(self, bts: int) -> Union[None, BaseEvent]:
+        """
+        Sequentially decodes the given bytes.
+
+        This method processes individual bytes in a sequence,
+        which is great if you don't know the length of your events,
+        or you can't structure your bytes.
+
+        This method returns None when more bytes are required to decode,
+        and returns the final event when the decoding operation is completed.
+
+        Event interruption is supported in this method!
+        If you are unsure if out of place MIDI events will interrupt the stream,
+        then you should use this method to sort out the chaos.
+
+        :param bts: Byte to decode
+        :type bts: int
+        :return: None if more bytes are required, event if operation is completed
+        :rtype: Union[None, BaseEvent]
+        """
+
+        # Hand the byte off to the relevant handler:
+
+        return self._seq_table[bts](self, bts)
+
+    def _seq_data(self, num: int) -> Union[None, BaseEvent]:
+        """
+        Sequentially decodes a data byte.
+
+        We add the byte to the event we are working with,
+        using running status if we are not working with an event.
+        If the event now has all of it's data, we return it.
+
+        :param num: Data byte to decode
+        :type num: int
+        :return: None if more bytes are required, event if operation is completed
+        :rtype: Union[None, BaseEvent]
+        """
+
+        buf = self._buf
+        status = self._status
+
+        # Determine if we are using running status:
+
+        if not buf:
+
+            if not status:
+
+                # No running status, nothing we can do:
+
+                return None
+
+            buf.append(status)
+
+        # Add the byte to the data buffer:
+
+        buf.append(num)
+
+        # Check if the data is ready to return:
+
+        length = self._length_table[status]
+
+        if len(buf) - 1 == length and length < UNKNOWN_LENGTH:
+
+            # Decode the event:
+
+            return self._seq_complete(self._decoders[status](buf, 1))
+
+        # Not done, return None
+
+        return None
+
+    def _seq_status(self, num: int) -> Union[None, BaseEvent]:
+        """
+        Sequentially decodes a status byte.
+
+        We start working with the new event,
+        saving the event we are currently working with if it is interrupted.
+        If the status byte ends the current variable length event,
+        or the current event is unknown, then that event is returned.
+
+        :param num: Status byte to decode
+        :type num: int
+        :return: None if more bytes are required, event if operation is completed
+        :rtype: Union[None, BaseEvent]
+        """
+
+        buf = self._buf
+
+        if buf:
+
+            length = self._length_table[self._status]
+
+            if length == VARIABLE_LENGTH and self._end_table[self._status] == num:
+
+                # We came to the end of the variable length sequence:
+
+                return self._seq_end()
+
+            if length == UNKNOWN_LENGTH:
+
+                # Unknown events end at the next status message:
+
+                final = UnknownEvent(*buf)
+
+                # Start working with the new event:
+
+                buf[:] = (num,)
+                self._status = num
+
+                return final
+
+            # We are interrupting an event, save it for later:
+
+            self._seq_nest()
+
+        # Start working with the new event:
+
+        self._buf.append(num)
+        self._status = num
+
+        return None
+
+    def _seq_interrupt(self, num: int) -> BaseEvent:
+        """
+        Sequentially decodes a zero length status byte.
+
+        Zero length events interrupt the data flow,
+        so we return the event right away without altering our state.
+        The only exception is if the status byte ends
+        the current variable length event.
+
+        :param num: Status byte to decode
+        :type num: int
+        :return: Decoded event
+        :rtype: BaseEvent
+        """
+
+        status = self._status
+
+        if self._buf and self._length_table[status] == VARIABLE_LENGTH and self._end_table[status] == num:
+
+            # We came to the end of the variable length sequence:
+
+            return self._seq_end()
+
+        return self._decoders[num](self._buf, 0)
+
+    def _seq_end(self) -> BaseEvent:
+        """
+        Creates the variable length event we are working with.
+
+        :return: Decoded event
+        :rtype: BaseEvent
+        :raises: DecodeException: If the event can't be created from the data
+        """
+
+        status = self._status
+
+        event, has_channel, _ = self._info_table[status]
+
+        try:
+
+            final = event.frombytes(self._buf[1:]) if event.KIND == KIND_SYSEX else event(*self._buf[1:])
+
+        except DecodeException:
+
+            # Invalid event, don't leave it half decoded:
+
+            self.reset()
+
+            raise
+
+        if has_channel:
+
+            final.channel = status & 0x0F
+
+        return self._seq_complete(final)
+
+    def seq_decode_buffer(self, bts: bytes) -> List[BaseEvent]:
+        """
+        Sequentially decodes ALL bytes in the given buffer.
+
+        This is identical to passing each byte to seq_decode(),
+        except that we collect and return all completed events at once,
+        which saves a lot of overhead when many bytes are available.
+        Our sequential state is kept between calls,
+        so an event split across two buffers will be decoded
+        once the second buffer is provided.
+
+        :param bts: Bytes to decode
+        :type bts: bytes
+        :return: List of completed events
+        :rtype: List[BaseEvent]
+        """
+
+        final = []
+        append = final.append
+        table = self._seq_table
+        lengths = self._length_table
+
+        buf = self._buf
+        length = lengths[self._status]
+
+        for num in bts:
+
+            if buf and not num & 0x80:
+
+                # Data byte for the current event, add it directly:
+
+                buf.append(num)
+
+                if len(buf) - 1 != length or length >= UNKNOWN_LENGTH:
+
+                    continue
+
+                # Event is complete, decode it:
+
+                event = self._seq_complete(self._decoders[self._status](buf, 1))
+
+            else:
+
+                # Let the handler deal with this byte:
+
+                event = table[num](self, num)
+
+            # Our state may have changed, get it again:
+
+            buf = self._buf
+            length = lengths[self._status]
+
+            if event is not None:
+
+                append(event)
+
+        return final
+
+    def feed(self, data: Union[bytes, bytearray, memoryview]) -> List[BaseEvent]:
+        """
+        Feeds a chunk of a MIDI byte stream into this decoder.
+
+        This is meant for stream sources that hand out
+        chunks of bytes, such as sockets or ring buffers.
+        The chunk is read through a memoryview,
+        so no copies of the data are made,
+        and all events completed by the chunk are returned.
+        The chunk is passed to seq_decode_buffer(),
+        so decoders that override it, such as the MetaDecoder,
+        decode their own events here too.
+        Our sequential state is kept between calls.
+
+        The chunk is only read during this call,
+        so the source is free to reuse the memory afterwards.
+
+        :param data: Chunk of bytes to decode
+        :type data: Union[bytes, bytearray, memoryview]
+        :return: List of completed events
+        :rtype: List[BaseEvent]
+        """
+
+        view = memoryview(data)
+
+        if view.format != 'B' or view.ndim != 1:
+
+            # Read the view as unsigned bytes:
+
+            view = view.cast('B')
+
+        with view:
+
+            return self.seq_decode_buffer(view)
+
+    async def adecode_stream(self, reader: Any, size: int = 65536) -> AsyncIterator[BaseEvent]:
+        """
+        Decodes ALL events read from the given reader.
+
+        The reader can be any object with an awaitable 'read()' method
+        that returns empty bytes once there is no more data,
+        such as an asyncio.StreamReader or one of our protocol objects.
+        We read large chunks at a time and pass them to feed(),
+        so we only await once per chunk instead of once per byte.
+        Events are yielded as they are completed.
+
+        Because we use feed(), MIDI event interruption is supported,
+        and our sequential state is kept after the reader is exhausted.
+        Decoders that override seq_decode_buffer(), such as the MetaDecoder,
+        decode their own events here too.
+
+        :param reader: Object to read bytes from
+        :type reader: Any
+        :param size: Number of bytes to read at once, defaults to 65536
+        :type size: int, optional
+        :return: Async iterator of decoded events
+        :rtype: AsyncIterator[BaseEvent]
+        """
+
+        while True:
+
+            # Read the next chunk:
+
+            chunk = await reader.read(size)
+
+            if not chunk:
+
+                # No more data, we are done:
+
+                return
+
+            for event in self.feed(chunk):
+
+                yield event
+
+    def reset(self) -> None:
+        """
+        Resets the sequential decoding state of this decoder.
+
+        Any event that is currently being decoded will be lost,
+        as will the running status.
+        """
+
+        self._buf.clear()
+        self._status = 0
+
+        while self._stack:
+
+            # Drop the interrupted event, keep the buffer for later:
+
+            buf, _ = self._stack.pop()
+
+            buf.clear()
+            self._spare.append(buf)
+
+    def _seq_nest(self) -> None:
+        """
+        Saves the event we are currently decoding.
+
+        This is done when an event is interrupted by another event.
+        We push our buffer onto the stack and continue with a spare one,
+        and restore the saved event once the interrupting event is complete.
+        By default, any number of events can be interrupted.
+        If a nest limit is set and we are already holding that many interrupted events,
+        then the interrupted event is dropped.
+        """
+
+        limit = self.nest_limit
+
+        if limit is not None and len(self._stack) >= limit:
+
+            # Holding too many events, drop the interrupted one:
+
+            self._buf.clear()
+
+            return
+
+        self._stack.append((self._buf, self._status))
+
+        self._buf = self._spare.pop() if self._spare else bytearray()
+
+    def _seq_complete(self, final: BaseEvent) -> BaseEvent:
+        """
+        Cleans up after a sequentially decoded event is complete.
+
+        We clear the data buffer,
+        and restore the interrupted event if there is one.
+        Variable length events cancel running status.
+
+        :param final: Event that was decoded
+        :type final: BaseEvent
+        :return: The same event
+        :rtype: BaseEvent
+        """
+
+        self._buf.clear()
+
+        if self._stack:
+
+            # Restore the event we interrupted:
+
+            self._spare.append(self._buf)
+
+            self._buf, self._status = self._stack.pop()
+
+        elif self._length_table[self._status] == VARIABLE_LENGTH:
+
+            # No running status after variable length events:
+
+            self._status = 0
+
+        return final
+
+    def encode(self, event: BaseEvent) -> bytes:
+        """
+        Encodes the given event into bytes.
+
+        Events without any data (such as real time messages)
+        share a single bytes object for each status message,
+        which is handled when the event is converted into bytes.
+
+        :param event: Event to encode
+        :type event: BaseEvent
+        :return: Encoded bytes
+        :rtype: bytes
+        """
+
+        # Return the encoded data:
+
+        return bytes(event)
+
+    def encode_into(self, event: BaseEvent, buf: bytearray, offset: int = 0) -> int:
+        """
+        Encodes the given event into an existing buffer.
+
+        We write the event at the given offset,
+        overwriting any bytes that are already there.
+        If the buffer is not big enough, it will grow to fit the event.
+        The offset can be at most the length of the buffer,
+        in which case the event is added to the end.
+        This allows many events to be encoded into one preallocated buffer,
+        without creating bytes for each event.
+
+        We return the number of bytes written.
+
+        :param event: Event to encode
+        :type event: BaseEvent
+        :param buf: Buffer to write the event into
+        :type buf: bytearray
+        :param offset: Index to start writing at, defaults to 0
+        :type offset: int, optional
+        :return: Number of bytes written
+        :rtype: int
+        :raises: ValueError: If the offset is past the end of the buffer
+        """
+
+        if offset > len(buf):
+
+            # Writing here would append the bytes at the end instead:
+
+            raise ValueError("Offset {} is past the end of the buffer of length {}!".format(offset, len(buf)))
+
+        if event.KIND == KIND_META:
+
+            # Meta events have their own encoding:
+
+            data = bytes(event)
+
+            buf[offset:offset + len(data)] = data
+
+            return len(data)
+
+        status = event.statusmsg
+
+        if event.has_channel:
+
+            # Encode the channel number in the status message:
+
+            status = status & 0xF0 | event.channel
+
+        data = event.data
+        size = len(data)
+        end = offset + 1 + size
+
+        if size < 4 and end <= len(buf):
+
+            # Short event that fits, pack the status and data in one call:
+
+            _PACKERS[size](buf, offset, status, *data)
+
+            return end - offset
+
+        buf[offset:offset + 1] = _BYTES[status]
+        buf[offset + 1:end] = data
+
+        return end - offset
+
+    def encode_many(self, events: Iterable[BaseEvent]) -> bytes:
+        """
+        Encodes ALL given events into bytes.
+
+        This is identical to joining the result of encode() for each event,
+        except that we write each event into a single buffer,
+        instead of creating bytes for each event.
+
+        :param events: Events to encode
+        :type events: Iterable[BaseEvent]
+        :return: Encoded bytes
+        :rtype: bytes
+        """
+
+        out = bytearray()
+        append = out.append
+        extend = out.extend
+
+        for event in events:
+
+            if event.KIND == KIND_META:
+
+                # Meta events have their own encoding:
+
+                extend(bytes(event))
+
+                continue
+
+            status = event.statusmsg
+
+            if event.has_channel:
+
+                # Encode the channel number in the status message:
+
+                status = status & 0xF0 | event.channel
+
+            append(status)
+            extend(event.data)
+
+        return bytes(out)
+
+    def encode_track(self, events: Iterable[BaseEvent]) -> bytes:
+        """
+        Encodes ALL given events into bytes, using running status.
+
+        This is identical to encode_many(),
+        except that the status message of a channel event is left out
+        if it is the same as the status message of the previous event.
+        This is what most MIDI devices and files emit,
+        and makes the output much smaller when many events
+        are sent in a row on the same channel.
+
+        Any event that is not a channel event cancels running status,
+        so the output can be decoded by any of our decoding methods.
+
+        :param events: Events to encode
+        :type events: Iterable[BaseEvent]
+        :return: Encoded bytes
+        :rtype: bytes
+        """
+
+        out = bytearray()
+        append = out.append
+        extend = out.extend
+        running = -1
+
+        for event in events:
+
+            if not event.has_channel:
+
+                # Not a channel event, cancel running status:
+
+                running = -1
+
+                if event.KIND == KIND_META:
+
+                    # Meta events have their own encoding:
+
+                    extend(bytes(event))
+
+                    continue
+
+                append(event.statusmsg)
+
+            else:
+
+                status = event.statusmsg & 0xF0 | event.channel
+
+                if status != running:
+
+                    # New status message, write it and use it as running status:
+
+                    append(status)
+
+                    running = status
+
+            extend(event.data)
+
+        return bytes(out)
+
+
+class MetaDecoder(ModularDecoder):
+    """
+    MetaDecoder - Decodes Meta Events present in MIDI files.
+    
+    Because Meta events are specific to MIDI files,
+    and that decoding them is somewhat non-standard,
+    decoding operations for them are placed into a separate class
+    that is only used when necessary.
+
+    A meta event has a status message of 0xFF,
+    and has a 'type', 'length', and 'bytes' fields.
+    We use these fields to determine the type of event.
+
+    From here, it is quite simple as we are given the length of the event,
+    so we just read a specific amount of bytes.
+
+    This encoder is modular, similar to the ModularDecoder,
+    which allows custom meta events to be registered and loaded for proper decoding.
+    We inherit the ModularDecoder, and use it to decode any non-meta events.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._meta_table: List[Union[Type[BaseEvent], None]] = [None] * 256  # Collection of meta events, indexed by meta type
+        self.meta_default = UnknownMetaEvent  # Event to use for meta types we don't recognize
+
+        # --== Context Values: ==--
+        # These values should NOT be access or changed at any point,
+        # As the varlen/sequential decoder relies on these variables!
+
+        self.var_index = 0  # Number of bytes we have read in varlen decoding
+
+        self.meta_decode = False  # Value determining if we are in the process of decoding a meta event
+        self.meta_length = None  # Length of the Meta event to decode
+        self.meta_byts = bytearray()  # Collection of all meta bytes we are working with
+        self.meta_type = None  # Meta type we are working with
+
+        self.var_final = 0  # Temporary variable-length value to work with
+
+    @property
+    def meta_collection(self) -> Dict[int, Type[BaseEvent]]:
+        """
+        Gets the collection of meta events we are working with.
+
+        Like the event collection,
+        meta events are stored internally in a table of 256 slots,
+        one for each meta type.
+        This property builds a dictionary view of that table.
+        Altering the returned dictionary will NOT alter this decoder,
+        use load_event() for that!
+
+        :return: Dictionary mapping meta types to events
+        :rtype: Dict[int, Type[BaseEvent]]
+        """
+
+        return {meta_type: event for meta_type, event in enumerate(self._meta_table) if event is not None}
+
+    def _loaded_events(self) -> Tuple[Type[BaseEvent], ...]:
+        """
+        Gets each event we have loaded, in an order that can be loaded again.
+
+        We add the meta events after the events loaded by the ModularDecoder.
+
+        :return: Loaded events
+        :rtype: Tuple[Type[BaseEvent], ...]
+        """
+
+        return super()._loaded_events() + tuple(event for event in dict.fromkeys(self._meta_table) if event is not None)
+
+    def __reduce__(self) -> tuple:
+        """
+        Gets the info needed to pickle this decoder.
+
+        We also keep the event used for unknown meta types.
+
+        :return: Function to rebuild this decoder, and its arguments and state
+        :rtype: tuple
+        """
+
+        func, args, state = super().__reduce__()
+
+        state['meta_default'] = self.meta_default
+
+        return func, args, state
+
+    def reset(self) -> None:
+        """
+        Resets this decoder back to it's initial state.
+
+        This is useful for recovering from a botched decoding job.
+
+        This method is called automatically after each sequential
+        decoding operation, but it can be called manually when necessary.
+        """
+
+        # Reset the context variables:
+
+        self.var_index = 0
+        self.var_final = 0
+
+        self.meta_decode = False
+        self.meta_length = None
+        self.meta_byts.clear()
+        self.meta_type = None
+
+    def load_default(self) -> None:
+        """
+        Loads the default meta-handlers.
+        
+        We also load the default events as specified in the ModularDecoder.
+        """
+
+        for event in META_EVENTS:
+
+            # Add each meta event:
 
             self.load_event(event)
 
-    def load_event(self, event: BaseEvent):
+        # Also, load the default voice events in the ModularDecoder.
+        # Voice events occupy all default status messages below 0xF0:
+
+        self._copy_defaults(status for status in _default_tables()[0] if status < 0xF0)
+
+    def load_event(self, event: Type[BaseEvent]) -> None:
         """
         Loads the given event.
 
@@ -592,7 +1949,7 @@ class MetaDecoder(ModularDecoder):
         then we send it along to the ModularDecoder for loading.
 
         :param event: Event to be loaded
-        :type event: BaseEvent
+        :type event: Type[BaseEvent]
         """
 
         if not issubclass(event, BaseEvent):
@@ -603,20 +1960,22 @@ class MetaDecoder(ModularDecoder):
 
         # Check if the event is a meta event:
 
-        if event.statusmsg is META:
-            
+        kind = event.KIND
+
+        if kind == KIND_META:
+
             # Valid meta event, load it:
-            
-            self.meta_collection[event.type] = event
+
+            self._meta_table[event.type] = event
 
             return
 
-        elif event.statusmsg in (SYSTEM_EXCLUSIVE, EOX):
+        elif kind == KIND_SYSEX or kind == KIND_EOX:
 
             # Load the system exclusive event:
 
-            self.meta_collection[SYSTEM_EXCLUSIVE] = event
-            self.meta_collection[EOX] = event
+            self._meta_table[SYSTEM_EXCLUSIVE] = event
+            self._meta_table[EOX] = event
 
         else:
 
@@ -651,35 +2010,41 @@ class MetaDecoder(ModularDecoder):
 
         if status == META:
 
-            event = self.meta_collection[bts[1]]
+            event = self._meta_table[bts[1]] or self.meta_default
 
         else:
 
             # System exclusive event:
 
-            event = self.meta_collection[status]
+            event = self._meta_table[status] or self.meta_default
 
         # Check the length of the event:
 
-        length, num_read = self.read_varlen(bts[2:])
+        length, num_read = read_varlen(bts, 2)
+
+        start = num_read + 2
 
         # Check if our length is valid
 
-        assert length == len(bts[num_read+2:])
+        if length != len(bts) - start:
 
-        # Check if we are working with unknown event:
+            raise DecodeException("Meta event length {} does not match the {} bytes given!".format(length, len(bts) - start))
+
+        # Get a view of the values, no need to copy them:
 
-        final = bts[num_read+2:]
+        final = memoryview(bts)[start:]
+
+        # Check if we are working with unknown event:
 
         if event is UnknownMetaEvent:
 
-            # Add status message to the front:
+            # Pass the status message and type along with the data:
 
-            final = bytes(bts[0]) + bytes(bts[1]) + final
+            return event(bts[0], bts[1], *final)
 
-        return event(*final)
+        return event.frombytes(final) if event.KIND == KIND_SYSEX else event(*final)
 
-    def seq_decode(self, byte: bytes) -> Union[None, BaseEvent]:
+    def seq_decode(self, byte: int) -> Union[None, BaseEvent]:
         """
         Sequentially decodes the each byte given.
 
@@ -690,86 +2055,258 @@ class MetaDecoder(ModularDecoder):
         This method will return an event if we have enough data.
         Otherwise, we will return None if more data is needed.
 
-        :param byte: A single byte to
-        :type byte: bytes
+        :param byte: A single byte to decode
+        :type byte: int
         :return: BaseEvent or None if more data is needed
         :rtype: Union[None, BaseEvent]
         """
 
-        # Check if we are working with a valid status message:
+        if not self.meta_decode:
+
+            # Check if we are working with a valid status message:
+
+            if byte in (META, SYSTEM_EXCLUSIVE, EOX):
+
+                # Configure ourselves to decode a Meta event
+
+                self.meta_decode = True
 
-        if byte in (META, SYSTEM_EXCLUSIVE, EOX):
+                if byte != META:
 
-            # Configure ourselves to decode a Meta event
+                    # Optimize for system exclusive events:
 
-            self.meta_decode = True
+                    self.meta_type = byte
 
-            if byte in (SYSTEM_EXCLUSIVE, EOX):
+                return None
+
+            # Otherwise, pass this data along:
+
+            return super().seq_decode(byte)
+
+        # We are working with a Meta Event, do something about it:
 
-                # Optimize for system exclusive events:
+        if self.meta_type is None:
 
-                self.meta_type = byte
+            # No event type specified, current byte should be it:
+
+            self.meta_type = byte
 
             return None
 
-        if self.meta_decode:
+        if self.meta_length is None:
+
+            # No meta length specified, current byte should be part of it:
+
+            self.var_final = (self.var_final << 7) | (byte & 0x7F)
+            self.var_index += 1
+
+            if byte & 0x80:
 
-            # We are working with a Meta Event, do something about it:
+                if self.var_index == 4:
 
-            if not self.meta_type:
+                    # Varlens are at most 4 bytes, this length is invalid:
 
-                # No event type specified, current byte should be it:
+                    self.reset()
 
-                self.meta_type = byte
+                    raise DecodeException("Varlen is longer than 4 bytes!")
 
-                event = self.meta_collection[self.meta_type]
+                # Need more bytes for the length:
 
                 return None
 
-            elif not self.meta_length:
+            self.meta_length = self.var_final
+
+            self.var_final = 0
+            self.var_index = 0
+
+        else:
+
+            # Append the byte to the buffer:
+
+            self.meta_byts.append(byte)
 
-                # No meta length specified, current byte should be it:
+        if len(self.meta_byts) == self.meta_length:
 
-                res, _ = self.read_varlen([byte])
+            # We are done! Create the object and reset:
 
-                if res is not None:
+            event = self._meta_table[self.meta_type] or self.meta_default
 
-                    # Got our value! Set it...
+            if event is UnknownMetaEvent:
 
-                    self.meta_length = res
+                # Unknown meta event, attach additional info:
+
+                final = event(META, self.meta_type, *self.meta_byts)
 
             else:
-            
-                # Append the byte to the list:
 
-                self.meta_byts.append(byte)
+                final = event.frombytes(self.meta_byts) if event.KIND == KIND_SYSEX else event(*self.meta_byts)
+
+            self.reset()
 
-            if len(self.meta_byts) == self.meta_length:
-  
-                # We are done! Create the object and reset:
+            return final
 
-                event = self.meta_collection[self.meta_type]
+        # More data is needed, return None
 
-                if event.statusmsg == UNKNOWN_META:
+        return None
+
+    def decode_stream(self, bts: bytes) -> List[BaseEvent]:
+        """
+        Decodes ALL events in the given bytes.
+
+        Meta events give their length up front,
+        so we read them directly.
+        The bytes between meta events are decoded in bulk by the ModularDecoder.
+        Meta and system exclusive events cancel running status,
+        so the bytes after them must start with a status message.
 
-                    # Unknown meta event, attach additional info:
+        :param bts: Bytes to decode
+        :type bts: bytes
+        :return: List of decoded events
+        :rtype: List[BaseEvent]
+        :raises: DecodeException: If the bytes are malformed or incomplete
+        """
 
-                    self.meta_byts.insert(0, self.meta_type)
-                    self.meta_byts.insert(0, META)
+        final = []
+        view = memoryview(bts)
+        index = 0
+        size = len(view)
 
-                final = event(*self.meta_byts)
+        while index < size:
 
-                self.reset()
+            # Decode everything up to the next meta event in bulk:
 
-                return event
+            match = _META_START.search(view, index)
 
-            # More data is needed, return None
+            stop = match.start() if match else size
 
-            return None
+            if stop > index:
+
+                final.extend(super().decode_stream(view[index:stop].tobytes()))
+
+            if match is None:
+
+                break
+
+            # Read the type and length of the meta event:
+
+            status = view[stop]
+            meta_type = status
+            start = stop + 1
+
+            if status == META:
+
+                if start == size:
+
+                    raise DecodeException("Meta event at index {} has no type!".format(stop))
+
+                meta_type = view[start]
+                start += 1
+
+            length, num_read = read_varlen(view, start)
+
+            start += num_read
+            index = start + length
+
+            if index > size:
+
+                raise DecodeException("Meta event needs {} data bytes, but only {} were given!".format(length, size - start))
+
+            # Create the event from a view of the values:
+
+            event = self._meta_table[meta_type if status == META else status] or self.meta_default
+
+            data = view[start:index]
+
+            if event is UnknownMetaEvent:
+
+                # Pass the status message and type along with the data:
+
+                final.append(event(status, meta_type, *data))
+
+            else:
+
+                final.append(event.frombytes(data) if event.KIND == KIND_SYSEX else event(*data))
+
+        return final
+
+    def scan_stream(self, bts: bytes) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Finds the boundaries of ALL events in the given bytes,
+        without creating any events.
+
+        The boundaries are used to build a DecodedTrack,
+        which can't hold meta events.
+        If the bytes contain a meta event,
+        then we raise a DecodeException,
+        decode_stream() should be used instead.
+
+        :param bts: Bytes to scan
+        :type bts: bytes
+        :return: Status messages, start indexes, and stop indexes of each event
+        :rtype: Tuple[List[int], List[int], List[int]]
+        :raises: DecodeException: If the bytes are malformed or contain meta events
+        """
+
+        # Before any meta event, every byte above 0x7F is a status message,
+        # so the first match is always the start of a meta event:
+
+        match = _META_START.search(bts)
 
-        # Otherwise, pass this data along:
+        if match:
 
-        return super().seq_decode(byte)
+            raise DecodeException("Meta event at index {} can't be scanned, use decode_stream() instead!".format(match.start()))
+
+        return super().scan_stream(bts)
+
+    def seq_decode_buffer(self, bts: bytes) -> List[BaseEvent]:
+        """
+        Sequentially decodes ALL bytes in the given buffer.
+
+        Like the ModularDecoder, this is identical to passing each byte to seq_decode().
+        The bytes between meta events are decoded in bulk by the ModularDecoder.
+        Meta events are passed to seq_decode() one byte at a time,
+        as their data can contain any byte.
+
+        :param bts: Bytes to decode
+        :type bts: bytes
+        :return: List of completed events
+        :rtype: List[BaseEvent]
+        """
+
+        final = []
+        view = memoryview(bts)
+        index = 0
+        size = len(view)
+
+        while index < size:
+
+            if not self.meta_decode:
+
+                # Decode everything up to the next meta event in bulk:
+
+                match = _META_START.search(view, index)
+
+                stop = match.start() if match else size
+
+                final.extend(super().seq_decode_buffer(view[index:stop]))
+
+                index = stop
+
+                if index == size:
+
+                    break
+
+            # Working with a meta event, decode it one byte at a time:
+
+            event = self.seq_decode(view[index])
+
+            index += 1
+
+            if event is not None:
+
+                final.append(event)
+
+        return final
 
     def encode(self, event: BaseEvent) -> bytes:
         """
@@ -783,99 +2320,293 @@ class MetaDecoder(ModularDecoder):
         :rtype: bytes
         """
 
-        # Get the delta time:
-        
-        delta = self.write_varlen(event.delta)
- 
-        # Get event bytes:
+        # Encode the delta time:
+
+        buf = bytearray(self.write_varlen(event.delta))
+
+        # Encode the event bytes:
 
-        data = bytes(event)
+        buf += bytes(event)
 
-        return delta + data
+        return bytes(buf)
 
-    def read_varlen(self, source: List) -> Tuple[int, int]:
+    def encode_many(self, events: Iterable[BaseEvent]) -> bytes:
+        """
+        Encodes ALL given events into bytes.
+
+        Like encode(), we encode the delta time before each event.
+        We write each event into a single buffer,
+        instead of creating bytes for each event.
+
+        :param events: Events to encode
+        :type events: Iterable[BaseEvent]
+        :return: Bytes of the encoded events
+        :rtype: bytes
         """
-        Reads a varlen from a list-like source.
 
-        We will traverse this iterable one
-        byte at a time until we reach it's end
-        (Or until we find a valid var-len).
+        buf = bytearray()
 
-        This function will keep the state of the decoding
-        saved in this decoder,
-        so if the given object does not contain a var-len,
-        then we will (hopefully) catch it next time this function is called.
+        for event in events:
 
-        This function is deigned for iterables,
-        so any object implementing the '__next__()' 
-        dunder method can be used here.
-        This includes iterables like lists and tuples,
-        as well as protocol objects,
-        as they also implement the '__next__()' dunder method.
-        Do note, these protocol objects MUST be started if they are to be used!
+            write_varlen_into(buf, event.delta)
+            buf += bytes(event)
 
-        You can use this function to decode varlens a byte at a time,
-        or to read from an object until we encounter a valid varlen.
+        return bytes(buf)
 
-        We will return the result,
-        as well as the number of bytes read.
-        If we need more info to continue,
-        then we simply return None.
+    def encode_track(self, events: Iterable[BaseEvent]) -> bytes:
+        """
+        Encodes ALL given events into bytes, using running status.
 
-        :param source: Source to read bytes from
-        :type source: List
-        :return: Final value and number of bytes read
-        :rtype: Tuple[int, int]
+        Like encode(), we encode the delta time before each event.
+        Channel events leave out their status message
+        if it is the same as the status message of the previous event,
+        which is allowed in MIDI files.
+        Meta and system events cancel running status.
+
+        :param events: Events to encode
+        :type events: Iterable[BaseEvent]
+        :return: Bytes of the encoded events
+        :rtype: bytes
         """
 
-        for byte in source:
+        buf = bytearray()
+        running = -1
 
-            self.var_final = (self.var_final << 7) | (byte & 0x7f)
+        for event in events:
 
-            self.var_index += 1
+            write_varlen_into(buf, event.delta)
 
-            if byte < 0x80:
+            if not event.has_channel:
 
-                temp = self.var_final
-                temp2 = self.var_index
+                # Not a channel event, cancel running status:
 
-                self.var_final = 0
-                self.var_index = 0
+                running = -1
 
-                return temp, temp2
+                buf += bytes(event)
 
-        # Otherwise, return nothing:
+                continue
 
-        return None
+            status = event.statusmsg & 0xF0 | event.channel
+
+            if status != running:
+
+                # New status message, write it and use it as running status:
+
+                buf.append(status)
+
+                running = status
+
+            buf += bytes(event.data)
+
+        return bytes(buf)
+
+    def read_varlen(self, bts: bytes, start: int = 0) -> Tuple[int, int]:
+        """
+        Reads a varlen from the given bytes.
+
+        We return the final value,
+        as well as the number of bytes read.
+        This simply calls the read_varlen() function in misc,
+        so no state is kept in this decoder.
+
+        :param bts: Bytes to read from
+        :type bts: bytes
+        :param start: Index to start reading at, defaults to 0
+        :type start: int, optional
+        :return: Final value and number of bytes read
+        :rtype: Tuple[int, int]
+        """
+
+        return read_varlen(bts, start)
 
     def write_varlen(self, num: int) -> bytes:
         """
         Converts an integer into a collection of bytes.
 
         We return the converted bytes after the operation is complete.
+        This simply calls the write_varlen() function in misc.
 
         :param num: Number to encode
         :type num: int
         :return: Bytes of encoded data
         :rtype: bytes
         """
-    
-        bytes = []
 
-        while num:
+        return write_varlen(num)
+
+
+class DecodedTrack(object):
+    """
+    DecodedTrack - A compact collection of decoded events.
+
+    Creating an object for each event in a large track uses a lot of memory.
+    Instead, we keep the raw bytes of the track,
+    and the location of each event in a set of parallel arrays:
+
+    status - Status message of each event, channel included
+    start - Index of the first data byte of each event
+    stop - Index just past the last data byte of each event
+
+    Events are only created when they are accessed,
+    and they are not kept around afterwards.
+    This allows the events of a track to be inspected
+    (such as counting the events with a given status message)
+    without creating any events.
+
+    This object is usually created by ModularDecoder.decode_track(),
+    and uses that decoder to create events.
+    An empty track can also be created with only a decoder,
+    and filled using append().
+    The track can be converted back into bytes using 'bytes(track)',
+    where each event is written with it's status message.
+    """
+
+    __slots__ = ["decoder", "bts", "status", "start", "stop"]
+
+    def __init__(self, decoder: ModularDecoder, bts: Union[bytearray, None] = None, status: Union[bytearray, None] = None, start: Union[array, None] = None, stop: Union[array, None] = None) -> None:
+
+        self.decoder = decoder  # Decoder used to create and encode events
+        self.bts = bytearray() if bts is None else bts  # Raw bytes of the track
+        self.status = bytearray() if status is None else status  # Status message of each event
+        self.start = array('L') if start is None else start  # Index of the first data byte of each event
+        self.stop = array('L') if stop is None else stop  # Index just past the last data byte of each event
+
+    def __len__(self) -> int:
+        """
+        Returns the number of events in this track.
+        """
+
+        return len(self.status)
+
+    def __getitem__(self, index: int) -> BaseEvent:
+        """
+        Creates the event at the given index.
+
+        :param index: Index of the event
+        :type index: int
+        :return: Event at the index
+        :rtype: BaseEvent
+        """
+
+        return self.decoder._make_event(self.status[index], self.bts, self.start[index], self.stop[index])
+
+    def __iter__(self) -> Iterable[BaseEvent]:
+        """
+        Creates each event in this track, in order.
+
+        :return: Each event in the track
+        :rtype: Iterable[BaseEvent]
+        """
+
+        make = self.decoder._make_event
+        bts = self.bts
+
+        for status, start, stop in zip(self.status, self.start, self.stop):
+
+            yield make(status, bts, start, stop)
+
+    def data(self, index: int) -> bytes:
+        """
+        Gets the data bytes of the event at the given index,
+        without creating the event.
+
+        :param index: Index of the event
+        :type index: int
+        :return: Data bytes of the event
+        :rtype: bytes
+        """
+
+        return self.bts[self.start[index]:self.stop[index]]
+
+    def count(self, status: int) -> int:
+        """
+        Counts the events in this track with the given status message,
+        without creating any events.
+
+        Channel events should be given with their channel
+        encoded in the status message.
+
+        :param status: Status message to count
+        :type status: int
+        :return: Number of events with the status message
+        :rtype: int
+        """
+
+        return self.status.count(status)
+
+    def select(self, *statuses: int) -> 'DecodedTrack':
+        """
+        Gets the events in this track with any of the given status messages,
+        without creating any events.
+
+        We return a new DecodedTrack containing only the selected events,
+        in the same order.
+        The raw bytes are shared with this track, and are not copied.
+
+        :param statuses: Status messages to select
+        :type statuses: int
+        :return: DecodedTrack with the selected events
+        :rtype: DecodedTrack
+        """
+
+        wanted = set(statuses)
+
+        rows = [row for row in zip(self.status, self.start, self.stop) if row[0] in wanted]
+
+        if not rows:
+
+            # Nothing selected, return an empty track:
+
+            return DecodedTrack(self.decoder, self.bts)
+
+        status, start, stop = zip(*rows)
+
+        return DecodedTrack(self.decoder, self.bts, bytearray(status), array('L', start), array('L', stop))
+
+    def append(self, event: BaseEvent) -> None:
+        """
+        Adds the given event to the end of this track.
+
+        We only store the status message and data of the event,
+        the event object itself is not kept.
+        Only events with a valid status message can be stored,
+        so meta events and builtin yap-midi events can't be added.
+
+        :param event: Event to add
+        :type event: BaseEvent
+        :raises: ValueError: If the event can't be stored in this track
+        """
+
+        status = event.statusmsg
+
+        if event.KIND == KIND_META or not 0x80 <= status <= 0xFF:
+
+            raise ValueError("Event {} can't be stored in a DecodedTrack!".format(event.name))
 
-            bytes.append(num & 0x7f)
+        if event.has_channel:
+
+            # Encode the channel number in the status message:
+
+            status = status & 0xF0 | event.channel
+
+        bts = self.bts
 
-            num >>= 7
+        self.status.append(status)
+        self.start.append(len(bts))
 
-        if bytes:
+        bts.extend(event.data)
 
-            bytes.reverse()
+        self.stop.append(len(bts))
 
-            for i in range(len(bytes) - 1):
+    def __bytes__(self) -> bytes:
+        """
+        Encodes ALL events in this track into bytes.
 
-                bytes[i] |= 0x80
+        Each event is written with it's status message,
+        without creating any events.
 
-            return bytes
+        :return: Encoded bytes
+        :rtype: bytes
+        """
 
-        return [0]
+        return self.decoder._join_events(self.bts, self.status, self.start, self.stop)
@@ -23,6 +23,19 @@ class StopPlayback(YMidiBaseException):
     pass
 
 
+class DecodeException(YMidiBaseException, ValueError):
+    """
+    Exception raised when a decoder encounters invalid data.
+
+    This usually means that the bytes given to the decoder
+    are malformed or incomplete,
+    such as a variable length event that does not end with the correct event.
+    We also inherit ValueError, so this exception can be caught as one.
+    """
+
+    pass
+
+
 class ModuleCollectionException(YMidiBaseException):
     """
     Parent class for ModuleCollection errors.
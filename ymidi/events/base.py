@@ -10,8 +10,61 @@ IT IS NOT RECOMMENDED TO USE THESE EVENTS!
 You should instead import more relevant events from elsewhere.
 """
 
-from ymidi.constants import META
-from ymidi.misc import write_varlen
+from __future__ import annotations
+
+from typing import Sequence
+
+from ymidi.constants import META, KIND_NORMAL, KIND_META, KIND_SYSEX
+from ymidi.misc import write_varlen_into
+
+# Single byte values, indexed by the integer they represent:
+
+_BYTES = tuple(bytes((num,)) for num in range(256))
+
+
+def _make_init(fields, channel=False):
+    """
+    Generates an __init__ method that stores the given fields.
+
+    The generated method stores the data tuple
+    and each field in a single frame,
+    so we skip calling the __init__ method of the parent class
+    and unpacking the arguments again.
+
+    If the event has a channel,
+    then the method also accepts and stores a channel keyword argument.
+
+    :param fields: Names of the fields to store, in order
+    :type fields: Tuple[str, ...]
+    :param channel: Whether to accept a channel, defaults to False
+    :type channel: bool, optional
+    :return: Generated __init__ method
+    :rtype: Callable[..., None]
+    """
+
+    args = ", ".join(fields)
+
+    params = args + ", channel=0" if channel else args
+
+    source = ["def __init__(self, {}):".format(params), "    self._init_data(({},))".format(args)]
+
+    if channel:
+
+        # Store the channel:
+
+        source.append("    self.channel = channel")
+
+    for field in fields:
+
+        # Store the field:
+
+        source.append("    self.{0} = {0}".format(field))
+
+    namespace = {}
+
+    exec("\n".join(source), namespace)
+
+    return namespace['__init__']
 
 
 class BaseEvent(object):
@@ -32,24 +85,63 @@ class BaseEvent(object):
     to our __init__ method.
     This allows us to keep track of the MIDI data,
     and gives us the ability to encode MIDI events in a very quick way.
+
+    The timing and track values of an event start out
+    as defaults defined on this class,
+    and are only stored on the event once they are changed.
+    This keeps freshly decoded events small,
+    as most of them will never have these values altered.
+
+    Events that simply store each value under a name
+    can list these names under the 'fields' attribute,
+    and an __init__ method that stores them will be generated
+    when the class is created.
     """
 
-    __slots__ = ["tick", "data", "raw"]
+    __slots__ = ["data", "_bytes_cache"]
     name = "Base MIDI Event"
     length: int = 0
     statusmsg: int = 0x00
     has_channel: bool = False
+    KIND: int = KIND_NORMAL  # Kind of event, used by decoders
+
+    tick: int = 0  # Tick this event occurs on
+    delta: int = 0  # The delta time of this event in ticks
+    raw: bytes = b''  # RAW MIDI data associated with this event
+    track: int = -1  # Track we are apart of, -1 by default(No track)
+
+    time: int = 0  # Time since the start of the track that this event occurs on in microseconds
+    delta_time: int = 0  # Delta time in microseconds
+
+    fields: tuple = ()  # Names of the values of this event, used to generate __init__
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if 'fields' in cls.__dict__:
+
+            # Generate the __init__ method for these fields:
+
+            cls.__init__ = _make_init(cls.fields, cls.has_channel)
 
     def __init__(self, *args) -> None:
 
-        self.tick = 0  # Tick this event occurs on
-        self.delta = 0  # The delta time of this event in ticks
-        self.data = args  # Data included in this event
-        self.raw = b''  # RAW MIDI data associated with this event
-        self.track = -1  # Track we are apart of, -1 by default(No track)
+        self._init_data(args)
+
+    def _init_data(self, data: Sequence[int]) -> None:
+        """
+        Stores the data of this event, and sets up the values every event has.
+
+        Every constructor calls this method
+        instead of setting these values itself,
+        so values added to all events only need to be set up here.
 
-        self.time = 0  # Time since the start of the track that this event occurs on in microseconds
-        self.delta_time = 0  # Delta time in microseconds
+        :param data: Data included in this event
+        :type data: Sequence[int]
+        """
+
+        self.data = data  # Data included in this event
+        self._bytes_cache = None  # Encoded bytes, and the values they were encoded from
 
     def __len__(self):
         """
@@ -64,6 +156,15 @@ class BaseEvent(object):
         
         This is mostly used by encoders,
         and is great for serialization.
+
+        The encoded bytes are cached, along with the data and status message
+        they were created from.
+        If neither has changed since the last call,
+        then we return the cached bytes instead of encoding them again.
+
+        Events without data, such as realtime events,
+        share a single bytes object for each status message,
+        so nothing is created or cached for them.
         
         :return: Message in bytes
         :rtype: bytes
@@ -81,9 +182,29 @@ class BaseEvent(object):
 
              status = status & 0xF0 | self.channel
 
-        # Return the final data:
+        # Determine if our cached bytes are still valid:
+
+        data = self.data
+
+        if not data and 0x80 <= status:
+
+            # No data, the status message is all we need:
+
+            return _BYTES[status]
 
-        return bytes((status,) + self.data)
+        cache = self._bytes_cache
+
+        if cache is not None and cache[0] is data and cache[1] == status:
+
+            return cache[2]
+
+        # Encode and cache the final data:
+
+        final = bytes((status, *data))
+
+        self._bytes_cache = (data, status, final)
+
+        return final
 
 
 class ChannelMessage(BaseEvent):
@@ -103,7 +224,8 @@ class ChannelMessage(BaseEvent):
     has_channel = True
 
     def __init__(self, *args, channel=0) -> None:
-        super().__init__(*args)
+
+        self._init_data(args)
 
         self.channel = channel
 
@@ -155,6 +277,31 @@ class BaseSystemExclusiveMessage(SystemMessage):
     """
 
     name = "BaseSystemExclusive"
+    KIND = KIND_SYSEX
+
+    @classmethod
+    def frombytes(cls, data: bytes) -> BaseSystemExclusiveMessage:
+        """
+        Creates an event from a buffer of data bytes.
+
+        System exclusive messages can be very large,
+        so passing each value as an argument is expensive.
+        Instead, we store the data as a single bytes object.
+        If the data is already bytes, it is kept as is and NOT copied.
+
+        Decoders use this method to create system exclusive events.
+
+        :param data: Data bytes of the event, without the status messages
+        :type data: bytes
+        :return: Event containing the data
+        :rtype: BaseSystemExclusiveMessage
+        """
+
+        event = cls.__new__(cls)
+
+        event._init_data(bytes(data))
+
+        return event
 
 
 class BaseMetaMessage(BaseEvent):
@@ -167,6 +314,7 @@ class BaseMetaMessage(BaseEvent):
     name: str = "BaseMeta"
     statusmsg = META
     type: int = 0x00  # Meta event type
+    KIND = KIND_META
 
     def __bytes__(self) -> bytes:
         """
@@ -174,13 +322,31 @@ class BaseMetaMessage(BaseEvent):
         
         We are similar to the BaseEvent bytes method,
         except that we also encode the length and size.
+        Like the BaseEvent bytes method, the encoded bytes are cached.
 
         :return: Message in bytes
         :rtype: bytes
         """
 
-        # get the length as a varlen:
+        # Determine if our cached bytes are still valid:
+
+        data = self.data
+        cache = self._bytes_cache
+
+        if cache is not None and cache[0] is data and cache[1] == self.type:
+
+            return cache[2]
+
+        # Write the header, the length as a varlen, then the data:
+
+        buf = bytearray((self.statusmsg, self.type))
+
+        write_varlen_into(buf, len(data))
+
+        buf.extend(data)
+
+        final = bytes(buf)
 
-        length = tuple(write_varlen(len(self.data)))
+        self._bytes_cache = (data, self.type, final)
 
-        return bytes((self.statusmsg, self.type) + length + self.data)
+        return final
@@ -25,14 +25,9 @@ class StartPattern(BaseEvent):
     name: str = "StartPattern"
     statusmsg: int = -1
 
-    def __init__(self, length, format, num_tracks, divisions) -> None:
+    # Length of the pattern header, format, number of tracks and divisions of this pattern:
 
-        super().__init__(length, format, num_tracks, divisions)
-
-        self.length = length  # Length of the pattern header
-        self.format = format  # Format of this pattern
-        self.num_tracks = num_tracks  # Number of tracks in this pattern
-        self.divisions = divisions  # Divisions of this pattern
+    fields = ('length', 'format', 'num_tracks', 'divisions')
 
 
 class StartTrack(BaseEvent):
@@ -45,13 +40,7 @@ class StartTrack(BaseEvent):
 
     name: str = "StartTrack"
     statusmsg = -2
-
-    def __init__(self, chunk_type, length) -> None:
-
-        super().__init__(chunk_type, length)
-
-        self.chunk_type = chunk_type  # Type of track this is
-        self.length = length  # Length of this track
+    fields = ('chunk_type', 'length')  # Type and length of this track
 
 
 class StopPattern(BaseEvent):
@@ -76,12 +65,13 @@ class UnknownMetaEvent(BaseEvent):
     You probably should not attempt to work with these events
     unless you know what you are looking for!
     """
-    
+
     name: str = "UnknownMetaEvent"
     statusmsg: int = -4
 
     def __init__(self, status, meta_type, *args) -> None:
-        super().__init__(*args)
+
+        self._init_data(args)
 
         self.event_status = status  # Status message of the unknown event
         self.event_type = meta_type  # Event type
@@ -111,7 +101,8 @@ class UnknownEvent(BaseEvent):
     statusmsg: int = -5
 
     def __init__(self, status, *args) -> None:
-        super().__init__(*args)
+
+        self._init_data(args)
 
         self.statusmsg = status  # Status message of the unknown event
 
@@ -9,6 +9,7 @@ TODO: Improve meta event descriptions!
 
 from __future__ import annotations
 import string
+from typing import Iterable, List
 
 from ymidi.events.base import BaseMetaMessage
 from ymidi.constants import CHANNEL_PREFIX, COPYRIGHT, CUE_POINT, DEVICE_NAME, INSTRUMENT, KEY_SIGNATURE, LYRIC, MARKER, RESERVED, SEQUENCE_NUMBER, SMPTE_OFFSET, TEMPO_SET, TEXT, TIME_SIGNATURE, TRACK_END, TRACK_NAME
@@ -36,16 +37,95 @@ class MetaText(BaseMetaMessage):
     This event is optional, and can occur anywhere in the track,
     although it is recommended to put a text event at the beginning
     of a track, so the track can be properly named.
+
+    The text is not decoded when the event is created,
+    as most text events are never inspected.
+    Instead, the text is decoded from the data
+    each time the 'text' attribute is accessed.
+    Text is decoded as UTF-8 (which includes ASCII),
+    and falls back to latin-1 if the data is not valid UTF-8,
+    so decoding never fails.
     """
 
     name = "Text"
     type = TEXT
     length = -1
 
-    def __init__(self, *args) -> None:
-        super().__init__(*args)
+    @property
+    def text(self) -> str:
+        """
+        Gets the text of this event.
+
+        :return: Decoded text
+        :rtype: str
+        """
+
+        raw = bytes(self.data)
+
+        try:
+
+            return raw.decode()
+
+        except UnicodeDecodeError:
+
+            # Not valid UTF-8, use latin-1 which accepts all bytes:
+
+            return raw.decode('latin-1')
+
+    @text.setter
+    def text(self, text: str) -> None:
+        """
+        Sets the text of this event.
+
+        The text is encoded as UTF-8 and becomes the data of this event.
+
+        :param text: Text to set
+        :type text: str
+        """
+
+        self.data = tuple(text.encode())
+
+    @staticmethod
+    def decode_batch(events: Iterable[MetaText]) -> List[str]:
+        """
+        Decodes the text of many events at once.
+
+        Decoding each event on its own has a fixed cost per call,
+        which adds up for tracks with many text events,
+        such as lyrics in karaoke files.
+        Instead, we join the data of all events with NUL separators,
+        decode it in one call and split it back apart.
+
+        If any event contains a NUL byte,
+        or the data is not valid UTF-8,
+        then we fall back to decoding each event on its own,
+        so the results always match the 'text' attribute.
+
+        :param events: Text events to decode
+        :type events: Iterable[MetaText]
+        :return: Decoded text of each event, in order
+        :rtype: List[str]
+        """
 
-        self.text = bytes(args).decode()  # Decode the bytes into a string
+        events = list(events)
+
+        parts = [bytes(event.data) for event in events]
+
+        joined = b'\x00'.join(parts)
+
+        if joined.count(0) == len(parts) - 1:
+
+            try:
+
+                return joined.decode().split('\x00') if parts else []
+
+            except UnicodeDecodeError:
+
+                pass
+
+        # Can't decode in one go, decode each event:
+
+        return [event.text for event in events]
 
     @classmethod
     def fromstring(cls, str: string) -> MetaText:
@@ -57,13 +137,13 @@ class MetaText(BaseMetaMessage):
 
         :param str: String to work with
         :type str: String
+        :return: MetaText event containing the string
+        :rtype: MetaText
         """
 
         # Encode the string and pass it along:
 
-        cls(*str.encode())
-
-        return cls
+        return cls(*str.encode())
 
 
 class CopyrightNotice(MetaText):
@@ -158,11 +238,7 @@ class ChannelPrefix(BaseMetaMessage):
     name = "ChannelPrefix"
     type = CHANNEL_PREFIX
     length = 1
-    
-    def __init__(self, num) -> None:
-        super().__init__(num)
-        
-        self.num = num  # Channel number to map
+    fields = ('num',)  # Channel number to map
 
 
 class EndOfTrack(BaseMetaMessage):
@@ -184,20 +260,28 @@ class SetTempo(BaseMetaMessage):
 
     This sets the tempo in microseconds per quarter note,
     using the provided value.
+
+    The tempo is calculated from the data each time it is accessed,
+    so it is only computed for the events that are inspected.
     """
 
     name = "SetTempo"
     type = TEMPO_SET
     length = 3
+    fields = ('bt1', 'bt2', 'bt3')
 
-    def __init__(self, bt1, bt2, bt3) -> None:
-        super().__init__(bt1, bt2, bt3)
+    @property
+    def tempo(self) -> int:
+        """
+        Gets the tempo of this event in microseconds per quarter note.
 
-        self.bt1 = bt1
-        self.bt2 = bt2
-        self.bt3 = bt3
+        :return: Tempo in microseconds per quarter note
+        :rtype: int
+        """
 
-        self.tempo = bt1 * 65536 + bt2 * 256 + bt3
+        bt1, bt2, bt3 = self.data
+
+        return bt1 << 16 | bt2 << 8 | bt3
 
 
 class SMPTEOffset(BaseMetaMessage):
@@ -212,15 +296,7 @@ class SMPTEOffset(BaseMetaMessage):
     name = "SMPTEOffset"
     type = SMPTE_OFFSET
     length = 5
-
-    def __init__(self, hr, mn, se, fr, ff) -> None:
-        super().__init__(hr, mn, se, fr, ff)
-        
-        self.hr = hr
-        self.mn = mn
-        self.se = se
-        self.fr = fr
-        self.ff = ff
+    fields = ('hr', 'mn', 'se', 'fr', 'ff')
 
 
 class TimeSignature(BaseMetaMessage):
@@ -240,13 +316,9 @@ class TimeSignature(BaseMetaMessage):
     type = TIME_SIGNATURE
     length = 4
 
-    def __init__(self, numerator, denominator, cpm, npq) -> None:
-        super().__init__(numerator, denominator, cpm, npq)
+    # Numerator, denominator, MIDI clocks per metronome click, 32nd notes per quarter note:
 
-        self.numerator = numerator  # Numerator of the time signature
-        self.denominator = denominator  # Denominator of time signature
-        self.cpm = cpm  # MIDI clocks per metronome click
-        self.npq = npq  # 32nd notes per quarter note
+    fields = ('numerator', 'denominator', 'cpm', 'npq')
 
 
 class KeySignature(BaseMetaMessage):
@@ -267,12 +339,7 @@ class KeySignature(BaseMetaMessage):
     name = "KeySignature"
     type = KEY_SIGNATURE
     length = 2
-
-    def __init__(self, sf, mi) -> None:
-        super().__init__(sf, mi)
-
-        self.sf = sf
-        self.mi = mi
+    fields = ('sf', 'mi')
 
 
 class Reserved(BaseMetaMessage):
@@ -7,7 +7,8 @@ regardless of the channel.
 """
 
 from ymidi.events.base import SystemCommon
-from ymidi.constants import SONG_POSITION_POINTER, SONG_SELECT, TUNE_REQUEST, EOX
+from ymidi.events.system.mtc import MTCQuarterFrame
+from ymidi.constants import SONG_POSITION_POINTER, SONG_SELECT, TUNE_REQUEST, EOX, KIND_EOX
 
 
 class SongPositionPointer(SystemCommon):
@@ -28,12 +29,7 @@ class SongPositionPointer(SystemCommon):
     statusmsg = SONG_POSITION_POINTER
     name = "SongPositionPointer"
     length = 2
-
-    def __init__(self, lsb, msb) -> None:
-        super().__init__(lsb, msb)
-
-        self.lsb = lsb  # Least significant bit
-        self.msb = msb  # Most significant bit
+    fields = ('lsb', 'msb')  # Least and most significant bits
 
 
 class SongSelect(SystemCommon):
@@ -47,11 +43,7 @@ class SongSelect(SystemCommon):
     statusmsg = SONG_SELECT
     length = 1
     name = "SongSelect"
-
-    def __init__(self, song) -> None:
-        super().__init__(song)
-
-        self.song = song  # Selected song
+    fields = ('song',)  # Selected song
 
 
 class TuneRequest(SystemCommon):
@@ -77,8 +69,9 @@ class EOX(SystemCommon):
     statusmsg = EOX
     length = 0
     name = "EOX"
+    KIND = KIND_EOX
 
 
 # Tuple of all system common events:
 
-SYSTEM_COMMON_EVENTS = (SongPositionPointer, SongSelect, TuneRequest, EOX)
+SYSTEM_COMMON_EVENTS = (MTCQuarterFrame, SongPositionPointer, SongSelect, TuneRequest, EOX)
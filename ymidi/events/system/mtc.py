@@ -5,7 +5,10 @@ These events are rarely used in the context of musical performance,
 and many users will simply ignore them.
 """
 
+from __future__ import annotations
+
 from ymidi.events.base import SystemCommon
+from ymidi.constants import MTC_QUARTER_FRAME
 
 
 class MIDITimeCode(SystemCommon):
@@ -42,13 +45,53 @@ class MTCQuarterFrame(SystemCommon):
     * 5 - Minutes count MS nibble
     * 6 - Hours count LS nibble 
     * 7 - Hours count LS nibble
+
+    On the wire, the type and value are packed into a single data byte,
+    with the type in the upper nibble and the value in the lower nibble.
+    We store this byte as is, and unpack the type and value when they are accessed.
+    This event is created from the packed data byte, which is what decoders pass.
+    Use fromvalues() to create it from a type and value.
     """
 
-    __slots__ = ['type', 'value']
-    statusmsg = 0xF1
+    __slots__ = ['byte']
+    statusmsg = MTC_QUARTER_FRAME
+    name = "MTCQuarterFrame"
+    length = 1
+    fields = ('byte',)  # Packed type and value
+
+    @property
+    def type(self) -> int:
+        """
+        Gets the type of this quarter frame.
+
+        :return: Type of the quarter frame
+        :rtype: int
+        """
+
+        return self.byte >> 4
+
+    @property
+    def value(self) -> int:
+        """
+        Gets the value of this quarter frame.
+
+        :return: Value of the quarter frame
+        :rtype: int
+        """
+
+        return self.byte & 0x0F
+
+    @classmethod
+    def fromvalues(cls, type: int, value: int) -> MTCQuarterFrame:
+        """
+        Creates a quarter frame from the given type and value.
 
-    def __init__(self, type: int, value: int) -> None:
-        super().__init__()
+        :param type: Type of the quarter frame(0-7)
+        :type type: int
+        :param value: Value of the quarter frame(0-15)
+        :type value: int
+        :return: Quarter frame containing the type and value
+        :rtype: MTCQuarterFrame
+        """
 
-        self.type = type
-        self.value = value
+        return cls(type << 4 | value)
@@ -7,9 +7,12 @@ Sysexc messages send misc data such as patch parameters,
 sampler data, sequencer data, ect.
 """
 
+from __future__ import annotations
+
 from ymidi.events.base import BaseSystemExclusiveMessage
 from ymidi.events.system.common import EOX
 from ymidi.constants import SYSTEM_EXCLUSIVE
+from ymidi.errors import DecodeException
 
 
 class SystemExclusive(BaseSystemExclusiveMessage):
@@ -38,9 +41,11 @@ class SystemExclusive(BaseSystemExclusiveMessage):
     header = 0x00  # Header of the System Exclusive message
 
     def __init__(self, *args) -> None:
-        super().__init__()
 
-        self.data = args
+        # Pack the payload into a single bytes object,
+        # as dumps can be large and a tuple costs a pointer per value:
+
+        self._init_data(bytes(args))
 
 
 class UniversalSysExc(SystemExclusive):
@@ -67,6 +72,31 @@ class UniversalSysExc(SystemExclusive):
 
         self.device = device  # Device ID this message was intended for
 
+    @classmethod
+    def frombytes(cls, data: bytes) -> UniversalSysExc:
+        """
+        Creates an event from a buffer of data bytes.
+
+        The first byte is the device ID,
+        and the rest is the data of the event.
+
+        :param data: Data bytes of the event, without the status messages
+        :type data: bytes
+        :return: Event containing the data
+        :rtype: UniversalSysExc
+        :raises: DecodeException: If the data does not contain a device ID
+        """
+
+        if not len(data):
+
+            raise DecodeException("{} needs a device ID, but no data was given!".format(cls.name))
+
+        event = super().frombytes(data[1:])
+
+        event.device = data[0]
+
+        return event
+
 
 class RealTimeSysExc(SystemExclusive):
     """
@@ -34,13 +34,7 @@ class NoteEvent(ChannelMessage):
 
     __slots__ = ['pitch', 'velocity']
     length = 2
-
-    def __init__(self, pitch: int, velocity: int) -> None:
-
-        super().__init__(pitch, velocity)
-
-        self.pitch = pitch  # Pitch of the note, in raw MIDI note format
-        self.velocity = velocity  # Velocity of the note, in raw MIDI velocity format
+    fields = ('pitch', 'velocity')  # Pitch and velocity of the note, in raw MIDI format
 
 
 class NoteOn(NoteEvent):
@@ -91,11 +85,7 @@ class ProgramChange(ChannelVoiceMessage):
     statusmsg = PROGRAM_CHANGE
     name = "ProgramChange"
     length = 1
-
-    def __init__(self, program) -> None:
-        super().__init__(program)
-
-        self.program = program  # Program number to switch to
+    fields = ('program',)  # Program number to switch to
 
 
 class AfterTouch(ChannelVoiceMessage):
@@ -111,11 +101,7 @@ class AfterTouch(ChannelVoiceMessage):
     statusmsg = AFTER_TOUCH
     length = 1
     name = "AfterTouch"
-
-    def __init__(self, velocity) -> None:
-        super().__init__(velocity)
-
-        self.velocity = velocity
+    fields = ('velocity',)
 
 
 class PitchBendEvent(ChannelVoiceMessage):
@@ -129,13 +115,7 @@ class PitchBendEvent(ChannelVoiceMessage):
     statusmsg = PITCH_BEND
     length = 2
     name = "PitchBendEvent"
-
-    def __init__(self, fine, coarse) -> None:
-
-        super().__init__(fine, coarse)
-
-        self.fine = fine  # Fine setting for the event
-        self.coarse = coarse  # Corse setting for the event
+    fields = ('fine', 'coarse')  # Fine and coarse settings for the event
 
 
 class ControlChange(ChannelVoiceMessage):
@@ -154,13 +134,7 @@ class ControlChange(ChannelVoiceMessage):
     length = 2
     statusmsg = CONTROL_CHANGE
     name = 'Control Change'
-
-    def __init__(self, control, value) -> None:
-
-        super().__init__(control, value)
-
-        self.control = control  # Control number
-        self.value = value  # Value number
+    fields = ('control', 'value')  # Control number and value number
 
 
 # A tuple of ALL default voice events:
@@ -16,11 +16,21 @@ import asyncio
 
 from typing import Any, Union, Callable, Awaitable, Iterable
 from collections import defaultdict
+from itertools import chain
 from ymidi.handlers.maps import GLOBAL
 
 from ymidi.misc import ModuleCollection, BaseModule
 from ymidi.events.base import BaseEvent
 
+# Empty handler tuple, returned when no handlers are mapped to an event.
+# It is immutable, so sharing it between lookups is safe:
+
+_EMPTY = ()
+
+# Types that hold multiple events to map, bytes hold multiple status messages:
+
+_MULTIPLE = (tuple, list, set, frozenset, bytes, bytearray)
+
 
 class BaseHandler(BaseModule):
     """
@@ -48,8 +58,6 @@ class BaseHandler(BaseModule):
 
         super().__init__(name=name)
 
-        self._args: tuple = ()  # Arguments used in callback registration
-        self._callback: Callable[[BaseEvent,], Awaitable]  # Callback to be called
         self.collection: HandlerCollection
 
     async def handle(self, event: BaseEvent):
@@ -72,20 +80,38 @@ class BaseHandler(BaseModule):
 
         raise NotImplementedError("Handle method should be overloaded in child class!")
 
-    async def _run_function(self, event: BaseEvent):
+
+class _FunctionHandler(BaseHandler):
+    """
+    Handler that runs an external function.
+
+    This handler is created by HandlerCollection.callback(),
+    so functions can be registered without writing handler classes.
+    The function is called with this handler, the event,
+    and any extra arguments given at registration.
+    The external function MUST be a coroutine!
+    """
+
+    NAME = "FunctionHandler"
+
+    def __init__(self, func: Callable[..., Awaitable], args: tuple=(), name: str='') -> None:
+
+        super().__init__(name=name)
+
+        self._callback = func  # Callback to be called
+        self._args = args  # Arguments used in callback registration
+
+    async def handle(self, event: BaseEvent):
         """
         Runs the external function attached to this handler.
 
-        This method is usually used as the handle method for the handler.
-        The external function MUST be a coroutine!
-
         :param event: Event to handle
         :type event: BaseEvent
         """
 
         # Run the external function:
 
-        await self._callback(event, *self._args)
+        await self._callback(self, event, *self._args)
 
 
 class MetaHandler(BaseHandler):
@@ -193,6 +219,8 @@ class HandlerCollection(ModuleCollection):
         self.meta_map = defaultdict(list) # Tuple of meta events, in order of priority
         self.handler_map = defaultdict(list)  # Dictionary mapping events to handlers
         self.alt_maps = defaultdict(list)  # Temporary maps for events
+        self._meta_cache = {}  # Sorted meta handlers to run, indexed by status message
+        self._hand_cache = {}  # Global and status handlers to run, indexed by status message
 
         self.tasks = []  # List of currently running tasks
 
@@ -430,23 +458,9 @@ class HandlerCollection(ModuleCollection):
         :type args: list
         """
 
-        # Let's create a dummy BaseHandler:
-
-        temp = BaseHandler(name=name)
-
-        # Set the args:
-
-        if args is not None:
-
-            temp._args = tuple(args)
-
-        # Set the function:
-
-        temp._callback = func
+        # Create a handler that runs the function:
 
-        # Set the callback runner:
-
-        temp.handle = temp._run_function
+        temp = _FunctionHandler(func, () if args is None else tuple(args), name=name)
 
         # Register the handler with the given events:
 
@@ -512,6 +526,8 @@ class HandlerCollection(ModuleCollection):
         then we will simply return None.
 
         We only run the relevant meta handlers for this event.
+        The sorted meta handlers for each status message are cached,
+        and the cache is cleared whenever the mappings change.
 
         :param event: Event to be handled
         :type event: BaseEvent
@@ -519,9 +535,19 @@ class HandlerCollection(ModuleCollection):
         :rtype: BaseEvent, None
         """
 
-        # Get a list of MetaHandlers:
+        # Get the MetaHandlers, sorting them by priority if they are not cached:
+
+        status = event.statusmsg
+
+        meta = self._meta_cache.get(status)
+
+        if meta is None:
 
-        meta = self.meta_map[None] + self.meta_map[event.statusmsg]
+            meta_map = self.meta_map
+
+            meta = tuple(sorted(chain(meta_map.get(HandlerCollection.GLOBAL_EVENT, _EMPTY), meta_map.get(status, _EMPTY)), key=self._get_priority))
+
+            self._meta_cache[status] = meta
 
         for hand in meta:
 
@@ -550,24 +576,48 @@ class HandlerCollection(ModuleCollection):
         We run each event handler in an asyncio task for 'concurrency'.
         Event handlers should not alter the state of this collection,
         so it is safe to run them at the same time.
+        If only one handler is relevant,
+        then we await it directly, as a task is not needed.
 
-        We only run the relevant event handlers attached to this event.
+        We only run the relevant event handlers attached to this event,
+        which are the global handlers, the handlers mapped to the status message,
+        and any handlers temporarily mapped to this event instance.
 
         :param event: Event to handle
         :type event: BaseEvent
         """
 
-        # Now that the event is processed, let's get the relevant EventHandlers:
+        # Get the global and status handlers, merging them if they are not cached:
+
+        status = event.statusmsg
 
-        hands = self.handler_map[None] + self.alt_maps[event] if self.alt_maps[event] else self.handler_map
+        hands = self._hand_cache.get(status)
+
+        if hands is None:
+
+            handler_map = self.handler_map
+
+            hands = tuple(chain(handler_map.get(HandlerCollection.GLOBAL_EVENT, _EMPTY), handler_map.get(status, _EMPTY)))
+
+            self._hand_cache[status] = hands
+
+        # Get and clear the temp maps for this event:
+
+        alt = self.alt_maps.pop(event, None)
+
+        if alt:
+
+            hands = hands + tuple(alt)
 
         # Process the events!
 
-        final = await asyncio.gather(*hands)
+        if len(hands) == 1:
 
-        # Clear the temp maps
+            await hands[0].handle(event)
 
-        del self.alt_maps[event]
+        elif hands:
+
+            await asyncio.gather(*[hand.handle(event) for hand in hands])
 
     def _get_priority(self, val: MetaHandler) -> int:
         """
@@ -597,7 +647,18 @@ class HandlerCollection(ModuleCollection):
         :type hand: BaseHandler
         """
 
-        if isinstance(event, Iterable):
+        # Mappings are changing, clear the cached handlers:
+
+        self._meta_cache.clear()
+        self._hand_cache.clear()
+
+        if event == HandlerCollection.GLOBAL_EVENT:
+
+            # Register the event to ALL events, checked first as strings are iterable:
+
+            struct[HandlerCollection.GLOBAL_EVENT].append(hand)
+
+        elif isinstance(event, _MULTIPLE):
 
             # Register the handler to ALL given events:
 
@@ -607,12 +668,6 @@ class HandlerCollection(ModuleCollection):
 
                 struct[msg].append(hand)
 
-        elif event == HandlerCollection.GLOBAL_EVENT:
-
-            # Register the event to ALL events:
-
-            struct[HandlerCollection.GLOBAL_EVENT].append(hand)
-
         else:
 
             # Some other event type, let's register it anyway:
@@ -634,7 +689,18 @@ class HandlerCollection(ModuleCollection):
         :type remove: bool 
         """
 
-        if isinstance(event, Iterable):
+        # Mappings are changing, clear the cached handlers:
+
+        self._meta_cache.clear()
+        self._hand_cache.clear()
+
+        if event == HandlerCollection.GLOBAL_EVENT:
+
+            # Remove the handler from global events, checked first as strings are iterable:
+
+            struct[HandlerCollection.GLOBAL_EVENT].remove(hand)
+
+        elif isinstance(event, _MULTIPLE):
 
             # Register the handler to ALL given events:
 
@@ -658,12 +724,6 @@ class HandlerCollection(ModuleCollection):
 
                         val.remove(hand)
 
-        elif event == HandlerCollection.GLOBAL_EVENT:
-
-            # Remove the handler from global events:
-
-            struct[HandlerCollection.GLOBAL_EVENT].remove(hand)
-
         else:
 
             # Remove the handler from the given event:
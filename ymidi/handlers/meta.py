@@ -14,8 +14,6 @@ Sys exc. adder?
 Arpegiator and other musical enhancements?
 """
 
-import asyncio
-
 from typing import Any, Union
 
 from ymidi.handlers.base import MetaHandler
@@ -14,7 +14,11 @@ from ymidi.events.base import BaseEvent
 from ymidi.events.meta import EndOfTrack
 from ymidi.events.builtin import StartPattern, StartTrack, StopPattern
 from ymidi.constants import META, SYSTEM_EXCLUSIVE, TRACK_END, EOX
-from ymidi.misc import write_varlen
+from ymidi.misc import write_varlen, aread_varlen
+
+_CHUNK_HEADER = struct.Struct('>4sL')  # Chunk type and length of a chunk header
+_FILE_HEADER = struct.Struct('>4sLHHH')  # ID, length, format, number of tracks, and divisions of a file header
+_HEADER_DATA = struct.Struct('>3h')  # Format, number of tracks, and divisions of a header chunk
 
 
 class MIDIFile(BaseIO):
@@ -270,7 +274,7 @@ class MIDIFile(BaseIO):
 
         # Read in header data:
 
-        data = struct.unpack('>4sL', await self.proto.read(8))
+        data = _CHUNK_HEADER.unpack(await self.proto.read(8))
 
         # Return the data:
 
@@ -289,9 +293,9 @@ class MIDIFile(BaseIO):
         :rtype: Tuple[int, int, int, int]
         """
 
-        # Get the ID:
+        # Read the entire header at once:
 
-        id = await self.proto.read(4)
+        id, length, format, self.num_tracks, division = _FILE_HEADER.unpack(await self.proto.read(_FILE_HEADER.size))
 
         # Check to make sure this is a valid MIDI file:
 
@@ -301,22 +305,6 @@ class MIDIFile(BaseIO):
 
             raise ValueError("Invalid file header!")
 
-        # Get the length of the header:
-
-        length = int.from_bytes(await self.proto.read(4), 'big')
-
-        # Get the format of this MIDI file:
-
-        format = int.from_bytes(await self.proto.read(2), 'big')
-
-        # Get the number of tracks in this file:
-
-        self.num_tracks = int.from_bytes(await self.proto.read(2), 'big')
-
-        # Get the byte division:
-
-        division = int.from_bytes(await self.proto.read(2), 'big')
-
         # Return the data:
 
         return StartPattern(length, format, self.num_tracks, division)
@@ -334,7 +322,7 @@ class MIDIFile(BaseIO):
 
         # Read the delta time:
 
-        delta, read = self.decoder.read_varlen(self.proto)
+        delta, read = await aread_varlen(self.proto)
 
         res = None
         blah = []
@@ -382,7 +370,7 @@ class MIDIFile(BaseIO):
 
         # Read the delta time:
 
-        delta, _ = self.decoder.read_varlen(self.proto)
+        delta, _ = await aread_varlen(self.proto)
 
         res = None
         data = None
@@ -401,7 +389,7 @@ class MIDIFile(BaseIO):
 
             # Get the length:
 
-            length, _ = self.decoder.read_varlen(self.proto)
+            length, _ = await aread_varlen(self.proto)
 
             # Read all bytes:
 
@@ -414,7 +402,7 @@ class MIDIFile(BaseIO):
             temp = b''
             offset = 0
 
-            if self.decoder.is_data(status[0]):
+            if not status[0] & 0x80:
 
                 # Use running status ...
  
@@ -458,7 +446,7 @@ class MIDIFile(BaseIO):
 
         # Get and return the data:
 
-        return await self.proto.write(struct.pack('>4sL', bytes(track_type, encoding='ascii'), length))
+        return await self.proto.write(_CHUNK_HEADER.pack(bytes(track_type, encoding='ascii'), length))
 
     async def write_file_header(self, length:int, format:int, num_tracks: int, byte_div: int) -> int:
         """
@@ -486,7 +474,7 @@ class MIDIFile(BaseIO):
 
         # Encode the number of tracks:
 
-        data += struct.pack(">3h", format, num_tracks, byte_div)
+        data += _HEADER_DATA.pack(format, num_tracks, byte_div)
 
         # Write the data:
 
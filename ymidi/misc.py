@@ -6,10 +6,10 @@ from __future__ import annotations
 
 import asyncio
 
-from typing import Any
+from typing import Any, Tuple
 from time import perf_counter_ns
 
-from ymidi.errors import ModuleLoadException, ModuleStartException, ModuleStopException, ModuleUnloadException
+from ymidi.errors import ModuleLoadException, ModuleStartException, ModuleStopException, ModuleUnloadException, DecodeException
 
 # Function that yap-midi uses to get time:
 
@@ -42,33 +42,153 @@ def write_varlen(num: int) -> bytes:
     """
     Converts an integer into a collection of bytes.
 
+    A varlen is at most 4 bytes long,
+    so instead of working with one 7 bit group at a time,
+    we spread all groups into a single integer using masks,
+    and set the continuation bit of every byte but the last at once.
+    The number of bytes is determined from the bit length of the number.
+
     We return the converted bytes after the operation is complete.
 
     :param num: Number to encode
     :type num: int
     :return: Bytes of encoded data
     :rtype: bytes
+    :raises: ValueError: If the number can't be encoded as a varlen
     """
-                
-    bts = []
-        
-    while num:
-             
-        bts.append(num & 0x7f)
- 
-        num >>= 7
 
-    if bts:
+    if not 0 <= num <= 0x0FFFFFFF:
+
+        raise ValueError("Varlen values must be between 0 and 0x0FFFFFFF, got {}!".format(num))
+
+    count = (num.bit_length() + 6) // 7 or 1
+
+    # Spread the groups out, and add the continuation bits:
+
+    word = (num & 0x7F) | (num << 1 & 0x7F00) | (num << 2 & 0x7F0000) | (num << 3 & 0x7F000000) | (0x80808000 & ((1 << 8 * count) - 1))
+
+    return word.to_bytes(count, 'big')
+
+
+def write_varlen_into(buf: bytearray, num: int) -> int:
+    """
+    Encodes an integer as a varlen at the end of the given buffer.
+
+    This is identical to write_varlen(),
+    except that the bytes are appended to an existing buffer.
+
+    We return the number of bytes written.
+
+    :param buf: Buffer to append the varlen to
+    :type buf: bytearray
+    :param num: Number to encode
+    :type num: int
+    :return: Number of bytes written
+    :rtype: int
+    :raises: ValueError: If the number can't be encoded as a varlen
+    """
+
+    bts = write_varlen(num)
+
+    buf += bts
+
+    return len(bts)
+
+
+def read_varlen(bts: bytes, start: int = 0) -> Tuple[int, int]:
+    """
+    Reads a varlen from the given bytes.
+
+    A varlen is at most 4 bytes long,
+    so instead of working with one byte at a time,
+    we read all 4 bytes into a single integer.
+    The first byte without the continuation bit ends the varlen,
+    which we find by checking the top bit of every byte at once.
+    We then pack the 7 bit groups together using masks.
+
+    We return the final value, as well as the number of bytes read.
+
+    :param bts: Bytes to read from
+    :type bts: bytes
+    :param start: Index to start reading at, defaults to 0
+    :type start: int, optional
+    :return: Final value and number of bytes read
+    :rtype: Tuple[int, int]
+    """
+
+    # Read up to 4 bytes, padding with zeros:
+
+    chunk = bts[start:start + 4]
+
+    word = int.from_bytes(chunk, 'big') << (8 * (4 - len(chunk)))
+
+    # Find the first byte without a continuation bit:
+
+    ends = ~word & 0x80808080
+
+    if not ends:
+
+        raise DecodeException("Varlen is longer than 4 bytes!")
+
+    num_read = (32 - ends.bit_length()) // 8 + 1
+
+    if num_read > len(chunk):
+
+        raise DecodeException("Varlen is incomplete!")
+
+    # Drop the bytes after the varlen, and pack the 7 bit groups:
+
+    word >>= 8 * (4 - num_read)
+
+    return (word & 0x7F) | (word >> 1 & 0x3F80) | (word >> 2 & 0x1FC000) | (word >> 3 & 0xFE00000), num_read
+
+
+async def aread_varlen(proto: Any) -> Tuple[int, int]:
+    """
+    Reads a varlen from the given protocol object.
+
+    We await each byte from the protocol's read() method,
+    so the event loop is free to do other work while we wait.
+    Only the I/O is asynchronous, the decoding is simple bit manipulation.
+
+    We return the final value, as well as the number of bytes read.
+    Like read_varlen(), we stop after 4 bytes,
+    so malformed data can't make us read until the end of the file.
+
+    :param proto: Protocol object to read from
+    :type proto: BaseProtocol
+    :return: Final value and number of bytes read
+    :rtype: Tuple[int, int]
+    :raises: DecodeException: If the varlen is incomplete or longer than 4 bytes
+    """
+
+    value = 0
+    num_read = 0
+
+    while True:
+
+        byte = await proto.read(1)
+
+        if not byte:
+
+            raise DecodeException("Reached the end of the data while reading a varlen!")
+
+        byte = byte[0]
+        num_read += 1
+
+        value = (value << 7) | (byte & 0x7F)
+
+        if not byte & 0x80:
+
+            # Last byte of the varlen, we are done:
 
-        bts.reverse()
+            return value, num_read
 
-        for i in range(len(bts) - 1):
+        if num_read == 4:
 
-            bts[i] |= 0x80
- 
-        return bytes(bts)
+            # Varlens are at most 4 bytes, this one is invalid:
 
-    return bytes([0])
+            raise DecodeException("Varlen is longer than 4 bytes!")
 
 
 def de_to_ms(delta: int, division: int, tempo: int) -> int: